@@ -9,15 +9,16 @@ namespace FolderFresh.Tests.Actions;
 /// These tests verify that CalculateAllDestinationPaths produces accurate predictions
 /// of where files will end up after rule execution.
 /// </summary>
-public class DestinationCalculationTests : IDisposable
+[Trait("Category", "FileSystem")]
+public class DestinationCalculationTests : IClassFixture<RuleServiceFixture>, IDisposable
 {
     private readonly TestFileHelper _helper;
     private readonly RuleService _ruleService;
 
-    public DestinationCalculationTests()
+    public DestinationCalculationTests(RuleServiceFixture fixture)
     {
         _helper = new TestFileHelper();
-        _ruleService = new RuleService();
+        _ruleService = fixture.RuleService;
     }
 
     public void Dispose() => _helper.Dispose();
@@ -140,52 +141,25 @@ public class DestinationCalculationTests : IDisposable
 
     #region SortIntoSubfolder Tests
 
-    [Fact]
-    public void SortIntoSubfolder_StaticName_Works()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var basePath = _helper.TestDirectory;
-
-        var rule = RuleBuilder.Create()
-            .WithSortIntoSubfolder("PDFs")
-            .Build();
-
-        var destinations = _ruleService.CalculateAllDestinationPaths(rule, file, basePath);
-
-        Assert.Single(destinations);
-        Assert.Equal(Path.Combine(basePath, "PDFs", "document.pdf"), destinations[0]);
-    }
-
-    [Fact]
-    public void SortIntoSubfolder_WithKindPattern_ExpandsCorrectly()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var basePath = _helper.TestDirectory;
-
-        var rule = RuleBuilder.Create()
-            .WithSortIntoSubfolder("{Kind}")
-            .Build();
-
-        var destinations = _ruleService.CalculateAllDestinationPaths(rule, file, basePath);
-
-        Assert.Single(destinations);
-        Assert.Equal(Path.Combine(basePath, "PDF", "document.pdf"), destinations[0]);
-    }
-
-    [Fact]
-    public void SortIntoSubfolder_WithExtensionPattern_ExpandsCorrectly()
+    [Theory]
+    [InlineData("PDFs", "PDFs")]                          // Static name
+    [InlineData("{Kind}", "PDF")]                         // Kind pattern
+    [InlineData("{Extension}", "pdf")]                    // Extension pattern
+    [InlineData("Archives/2024/Q1", "Archives/2024/Q1")]  // Forward slashes use the platform separator
+    public void SortIntoSubfolder_Pattern_ExpandsCorrectly(string pattern, string expectedSubfolder)
     {
         var file = _helper.CreateFile("document.pdf");
         var basePath = _helper.TestDirectory;
 
         var rule = RuleBuilder.Create()
-            .WithSortIntoSubfolder("{Extension}")
+            .WithSortIntoSubfolder(pattern)
             .Build();
 
         var destinations = _ruleService.CalculateAllDestinationPaths(rule, file, basePath);
 
         Assert.Single(destinations);
-        Assert.Equal(Path.Combine(basePath, "pdf", "document.pdf"), destinations[0]);
+        var expectedFolder = Path.Combine(new[] { basePath }.Concat(expectedSubfolder.Split('/')).ToArray());
+        Assert.Equal(Path.Combine(expectedFolder, "document.pdf"), destinations[0]);
     }
 
     [Fact]
@@ -204,23 +178,6 @@ public class DestinationCalculationTests : IDisposable
         Assert.Equal(Path.Combine(basePath, "2024", "06", "document.pdf"), destinations[0]);
     }
 
-    [Fact]
-    public void SortIntoSubfolder_ForwardSlash_NormalizedToBackslash()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var basePath = _helper.TestDirectory;
-
-        var rule = RuleBuilder.Create()
-            .WithSortIntoSubfolder("Archives/2024/Q1")
-            .Build();
-
-        var destinations = _ruleService.CalculateAllDestinationPaths(rule, file, basePath);
-
-        Assert.Single(destinations);
-        // Should use platform-appropriate separator
-        Assert.Equal(Path.Combine(basePath, "Archives", "2024", "Q1", "document.pdf"), destinations[0]);
-    }
-
     #endregion
 
     #region Rename Tests
@@ -352,6 +309,80 @@ public class DestinationCalculationTests : IDisposable
 
     #endregion
 
+    #region ResolveMoveDestinationFolder Tests
+
+    [Theory]
+    [InlineData("Renamed.pdf", "Documents")]
+    [InlineData("{Name}_{Date}.{ext}", "Archives/2024")]
+    public void ResolveMoveDestinationFolder_RenameThenMove_MatchesPredictedDestination(string renamePattern, string moveFolder)
+    {
+        var file = _helper.CreateFileWithDates("document.pdf", modifiedDate: new DateTime(2024, 6, 15));
+        var basePath = _helper.TestDirectory;
+
+        var rule = RuleBuilder.Create()
+            .WithRename(renamePattern)
+            .WithMoveToFolder(moveFolder)
+            .Build();
+
+        // Executors fuse Rename + Move into a single move to <move folder>/<new name>
+        var fusedFolder = RuleService.ResolveMoveDestinationFolder(rule.Actions[1], file, basePath, null);
+        var newName = RuleService.ExpandPattern(renamePattern, file);
+
+        Assert.NotNull(fusedFolder);
+        Assert.Equal(_ruleService.CalculateAllDestinationPaths(rule, file, basePath)[0], Path.Combine(fusedFolder, newName));
+    }
+
+    [Fact]
+    public void ResolveMoveDestinationFolder_SortIntoSubfolder_ExpandsPattern()
+    {
+        var file = _helper.CreateFile("photo.jpg");
+        var basePath = _helper.TestDirectory;
+        var action = new RuleAction { Type = ActionType.SortIntoSubfolder, Value = "Sorted/{Kind}" };
+
+        var folder = RuleService.ResolveMoveDestinationFolder(action, file, basePath, null);
+
+        Assert.Equal(Path.Combine(basePath, "Sorted", "Image"), folder);
+    }
+
+    [Fact]
+    public void ResolveMoveDestinationFolder_NonMoveAction_ReturnsNull()
+    {
+        var file = _helper.CreateFile("document.pdf");
+        var action = new RuleAction { Type = ActionType.CopyToFolder, Value = "Backup" };
+
+        Assert.Null(RuleService.ResolveMoveDestinationFolder(action, file, _helper.TestDirectory, null));
+    }
+
+    [Fact]
+    public void IsRenameFollowedByMove_MoveToOtherFolder_ReturnsTrue()
+    {
+        var file = _helper.CreateFile("document.pdf");
+        var rule = RuleBuilder.Create()
+            .WithRename("renamed.pdf")
+            .WithMoveToFolder("Documents")
+            .Build();
+
+        Assert.True(RuleService.IsRenameFollowedByMove(rule.Actions, 0, file, _helper.TestDirectory, _helper.TestDirectory, null));
+    }
+
+    [Fact]
+    public void IsRenameFollowedByMove_MoveToCurrentFolderOrNoMove_ReturnsFalse()
+    {
+        var file = _helper.CreateFile("document.pdf");
+        var basePath = _helper.TestDirectory;
+        var rule = RuleBuilder.Create()
+            .WithRename("renamed.pdf")
+            .WithMoveToFolder("Documents")
+            .WithRename("final.pdf")
+            .Build();
+
+        // Already in the move's destination, and last action with nothing to fuse with
+        Assert.False(RuleService.IsRenameFollowedByMove(rule.Actions, 0, file, basePath, Path.Combine(basePath, "Documents"), null));
+        Assert.False(RuleService.IsRenameFollowedByMove(rule.Actions, 2, file, basePath, basePath, null));
+    }
+
+    #endregion
+
     #region Special Actions Tests
 
     [Fact]
@@ -7,6 +7,7 @@ namespace FolderFresh.Tests.Actions;
 /// Tests for pattern expansion in rename and subfolder actions.
 /// Validates all supported tokens: {Name}, {Extension}, {Date}, {Kind}, etc.
 /// </summary>
+[Trait("Category", "FileSystem")]
 public class PatternExpansionTests : IDisposable
 {
     private readonly TestFileHelper _helper;
@@ -77,24 +78,21 @@ public class PatternExpansionTests : IDisposable
 
     #region Date Tokens (Modified Date)
 
-    [Fact]
-    public void Date_DefaultFormat()
-    {
-        var file = _helper.CreateFileWithDates("doc.pdf", modifiedDate: new DateTime(2024, 6, 15));
-
-        var result = RuleService.ExpandPattern("{Date}", file);
-
-        Assert.Equal("2024-06-15", result);
-    }
-
-    [Fact]
-    public void Date_LowercaseToken()
+    [Theory]
+    [InlineData("{Date}", "2024-06-15")]
+    [InlineData("{date}", "2024-06-15")]
+    [InlineData("{Year}", "2024")]
+    [InlineData("{year}", "2024")]
+    [InlineData("{Month}", "06")]  // Zero-padded
+    [InlineData("{month}", "06")]
+    [InlineData("{day}", "15")]
+    public void Date_ComponentTokens(string pattern, string expected)
     {
         var file = _helper.CreateFileWithDates("doc.pdf", modifiedDate: new DateTime(2024, 6, 15));
 
-        var result = RuleService.ExpandPattern("{date}", file);
+        var result = RuleService.ExpandPattern(pattern, file);
 
-        Assert.Equal("2024-06-15", result);
+        Assert.Equal(expected, result);
     }
 
     [Theory]
@@ -114,26 +112,6 @@ public class PatternExpansionTests : IDisposable
         Assert.Equal(expected, result);
     }
 
-    [Fact]
-    public void Year_Token()
-    {
-        var file = _helper.CreateFileWithDates("doc.pdf", modifiedDate: new DateTime(2024, 6, 15));
-
-        var result = RuleService.ExpandPattern("{Year}", file);
-
-        Assert.Equal("2024", result);
-    }
-
-    [Fact]
-    public void Month_Token_ZeroPadded()
-    {
-        var file = _helper.CreateFileWithDates("doc.pdf", modifiedDate: new DateTime(2024, 6, 15));
-
-        var result = RuleService.ExpandPattern("{Month}", file);
-
-        Assert.Equal("06", result);
-    }
-
     [Fact]
     public void Day_Token_ZeroPadded()
     {
@@ -144,62 +122,22 @@ public class PatternExpansionTests : IDisposable
         Assert.Equal("05", result);
     }
 
-    [Fact]
-    public void YearMonthDay_LowercaseTokens()
-    {
-        var file = _helper.CreateFileWithDates("doc.pdf", modifiedDate: new DateTime(2024, 6, 15));
-
-        var yearResult = RuleService.ExpandPattern("{year}", file);
-        var monthResult = RuleService.ExpandPattern("{month}", file);
-        var dayResult = RuleService.ExpandPattern("{day}", file);
-
-        Assert.Equal("2024", yearResult);
-        Assert.Equal("06", monthResult);
-        Assert.Equal("15", dayResult);
-    }
-
     #endregion
 
     #region Created Date Tokens
 
-    [Fact]
-    public void Created_CustomFormat()
-    {
-        var file = _helper.CreateFileWithDates("doc.pdf", createdDate: new DateTime(2023, 3, 20));
-
-        var result = RuleService.ExpandPattern("{created:yyyy-MM-dd}", file);
-
-        Assert.Equal("2023-03-20", result);
-    }
-
-    [Fact]
-    public void CreatedYear_Token()
-    {
-        var file = _helper.CreateFileWithDates("doc.pdf", createdDate: new DateTime(2023, 3, 20));
-
-        var result = RuleService.ExpandPattern("{CreatedYear}", file);
-
-        Assert.Equal("2023", result);
-    }
-
-    [Fact]
-    public void CreatedMonth_Token()
-    {
-        var file = _helper.CreateFileWithDates("doc.pdf", createdDate: new DateTime(2023, 3, 20));
-
-        var result = RuleService.ExpandPattern("{CreatedMonth}", file);
-
-        Assert.Equal("03", result);
-    }
-
-    [Fact]
-    public void CreatedDay_Token()
+    [Theory]
+    [InlineData("{created:yyyy-MM-dd}", "2023-03-20")]
+    [InlineData("{CreatedYear}", "2023")]
+    [InlineData("{CreatedMonth}", "03")]
+    [InlineData("{CreatedDay}", "20")]
+    public void Created_Tokens(string pattern, string expected)
     {
         var file = _helper.CreateFileWithDates("doc.pdf", createdDate: new DateTime(2023, 3, 20));
 
-        var result = RuleService.ExpandPattern("{CreatedDay}", file);
+        var result = RuleService.ExpandPattern(pattern, file);
 
-        Assert.Equal("20", result);
+        Assert.Equal(expected, result);
     }
 
     #endregion
@@ -7,198 +7,59 @@ namespace FolderFresh.Tests.Conditions;
 /// <summary>
 /// Tests for ConditionGroup logic (All/Any/None combinations)
 /// </summary>
-public class ConditionGroupTests : IDisposable
+public class ConditionGroupTests : IClassFixture<RuleServiceFixture>, IDisposable
 {
     private readonly TestFileHelper _helper;
     private readonly RuleService _ruleService;
 
-    public ConditionGroupTests()
+    public ConditionGroupTests(RuleServiceFixture fixture)
     {
         _helper = new TestFileHelper();
-        _ruleService = new RuleService();
+        _ruleService = fixture.RuleService;
     }
 
     public void Dispose() => _helper.Dispose();
 
-    #region MatchType.All (AND logic)
+    #region Match Types
 
-    [Fact]
-    public void All_AllConditionsTrue_ReturnsTrue()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.All,
-            Conditions = new List<Condition>
-            {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "pdf" },
-                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = "doc" }
-            }
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.True(result);
-    }
-
-    [Fact]
-    public void All_OneConditionFalse_ReturnsFalse()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.All,
-            Conditions = new List<Condition>
-            {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "pdf" },
-                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = "xyz" }  // False
-            }
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.False(result);
-    }
-
-    [Fact]
-    public void All_AllConditionsFalse_ReturnsFalse()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.All,
-            Conditions = new List<Condition>
-            {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "txt" },  // False
-                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = "xyz" }  // False
-            }
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.False(result);
-    }
-
-    #endregion
-
-    #region MatchType.Any (OR logic)
-
-    [Fact]
-    public void Any_AllConditionsTrue_ReturnsTrue()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.Any,
-            Conditions = new List<Condition>
-            {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "pdf" },
-                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = "doc" }
-            }
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.True(result);
-    }
-
-    [Fact]
-    public void Any_OneConditionTrue_ReturnsTrue()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.Any,
-            Conditions = new List<Condition>
-            {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "txt" },  // False
-                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = "doc" }  // True
-            }
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.True(result);
-    }
-
-    [Fact]
-    public void Any_AllConditionsFalse_ReturnsFalse()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.Any,
-            Conditions = new List<Condition>
-            {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "txt" },  // False
-                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = "xyz" }  // False
-            }
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.False(result);
-    }
-
-    #endregion
-
-    #region MatchType.None (NOT ANY logic)
-
-    [Fact]
-    public void None_AllConditionsFalse_ReturnsTrue()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.None,
-            Conditions = new List<Condition>
-            {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "txt" },  // False
-                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = "xyz" }  // False
-            }
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.True(result);  // None match = true
-    }
-
-    [Fact]
-    public void None_OneConditionTrue_ReturnsFalse()
+    /// <summary>
+    /// Builds the two-condition group shared by the match type tests:
+    /// extension is {extension} / name starts with {namePrefix}
+    /// </summary>
+    private static ConditionGroup CreateExtensionAndNameGroup(ConditionMatchType matchType, string extension, string namePrefix)
     {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
+        return new ConditionGroup
         {
-            MatchType = ConditionMatchType.None,
+            MatchType = matchType,
             Conditions = new List<Condition>
             {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "pdf" },  // True
-                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = "xyz" }  // False
+                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = extension },
+                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = namePrefix }
             }
         };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.False(result);  // One matches = false
     }
 
-    [Fact]
-    public void None_AllConditionsTrue_ReturnsFalse()
+    [Theory]
+    // All (AND logic)
+    [InlineData(ConditionMatchType.All, "pdf", "doc", true)]    // Both true
+    [InlineData(ConditionMatchType.All, "pdf", "xyz", false)]   // One false
+    [InlineData(ConditionMatchType.All, "txt", "xyz", false)]   // Both false
+    // Any (OR logic)
+    [InlineData(ConditionMatchType.Any, "pdf", "doc", true)]    // Both true
+    [InlineData(ConditionMatchType.Any, "txt", "doc", true)]    // One true
+    [InlineData(ConditionMatchType.Any, "txt", "xyz", false)]   // Both false
+    // None (NOT ANY logic)
+    [InlineData(ConditionMatchType.None, "txt", "xyz", true)]   // None match = true
+    [InlineData(ConditionMatchType.None, "pdf", "xyz", false)]  // One matches = false
+    [InlineData(ConditionMatchType.None, "pdf", "doc", false)]  // All match = false
+    public void MatchType_CombinesConditionResults(ConditionMatchType matchType, string extension, string namePrefix, bool expected)
     {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.None,
-            Conditions = new List<Condition>
-            {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "pdf" },
-                new() { Attribute = ConditionAttribute.Name, Operator = ConditionOperator.StartsWith, Value = "doc" }
-            }
-        };
+        var file = _helper.GetFileInfo("document.pdf");
+        var group = CreateExtensionAndNameGroup(matchType, extension, namePrefix);
 
         var result = _ruleService.EvaluateConditionGroup(group, file);
 
-        Assert.False(result);  // All match = false
+        Assert.Equal(expected, result);
     }
 
     #endregion
@@ -209,7 +70,7 @@ public class ConditionGroupTests : IDisposable
     public void NestedGroups_AllWithAny()
     {
         // Match: (extension is pdf OR txt) AND (name starts with doc)
-        var file = _helper.CreateFile("document.pdf");
+        var file = _helper.GetFileInfo("document.pdf");
         var group = new ConditionGroup
         {
             MatchType = ConditionMatchType.All,
@@ -240,7 +101,7 @@ public class ConditionGroupTests : IDisposable
     public void NestedGroups_AnyWithAll()
     {
         // Match: (extension is pdf AND name starts with doc) OR (extension is txt AND name starts with note)
-        var file = _helper.CreateFile("document.pdf");
+        var file = _helper.GetFileInfo("document.pdf");
         var group = new ConditionGroup
         {
             MatchType = ConditionMatchType.Any,
@@ -276,7 +137,7 @@ public class ConditionGroupTests : IDisposable
     public void NestedGroups_NoneWithAny()
     {
         // Match: NOT (extension is exe OR extension is bat)
-        var file = _helper.CreateFile("document.pdf");
+        var file = _helper.GetFileInfo("document.pdf");
         var group = new ConditionGroup
         {
             MatchType = ConditionMatchType.None,
@@ -300,6 +161,7 @@ public class ConditionGroupTests : IDisposable
     }
 
     [Fact]
+    [Trait("Category", "FileSystem")]
     public void NestedGroups_DeepNesting()
     {
         // Complex: ((A AND B) OR (C AND D)) AND E
@@ -350,13 +212,16 @@ public class ConditionGroupTests : IDisposable
 
     #region Empty Groups
 
-    [Fact]
-    public void EmptyGroup_MatchesEverything()
+    [Theory]
+    [InlineData(ConditionMatchType.All)]
+    [InlineData(ConditionMatchType.Any)]
+    [InlineData(ConditionMatchType.None)]
+    public void EmptyGroup_MatchesEverything(ConditionMatchType matchType)
     {
-        var file = _helper.CreateFile("anything.xyz");
+        var file = _helper.GetFileInfo("anything.xyz");
         var group = new ConditionGroup
         {
-            MatchType = ConditionMatchType.All,
+            MatchType = matchType,
             Conditions = new List<Condition>(),
             NestedGroups = new List<ConditionGroup>()
         };
@@ -366,65 +231,19 @@ public class ConditionGroupTests : IDisposable
         Assert.True(result);  // Empty group should match everything
     }
 
-    [Fact]
-    public void EmptyGroup_Any_MatchesEverything()
-    {
-        var file = _helper.CreateFile("anything.xyz");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.Any,
-            Conditions = new List<Condition>()
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.True(result);
-    }
-
-    [Fact]
-    public void EmptyGroup_None_MatchesEverything()
-    {
-        var file = _helper.CreateFile("anything.xyz");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.None,
-            Conditions = new List<Condition>()
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.True(result);
-    }
-
     #endregion
 
     #region Single Condition
 
-    [Fact]
-    public void SingleCondition_All_Works()
+    [Theory]
+    [InlineData(ConditionMatchType.All)]
+    [InlineData(ConditionMatchType.Any)]
+    public void SingleCondition_Works(ConditionMatchType matchType)
     {
-        var file = _helper.CreateFile("document.pdf");
+        var file = _helper.GetFileInfo("document.pdf");
         var group = new ConditionGroup
         {
-            MatchType = ConditionMatchType.All,
-            Conditions = new List<Condition>
-            {
-                new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "pdf" }
-            }
-        };
-
-        var result = _ruleService.EvaluateConditionGroup(group, file);
-
-        Assert.True(result);
-    }
-
-    [Fact]
-    public void SingleCondition_Any_Works()
-    {
-        var file = _helper.CreateFile("document.pdf");
-        var group = new ConditionGroup
-        {
-            MatchType = ConditionMatchType.Any,
+            MatchType = matchType,
             Conditions = new List<Condition>
             {
                 new() { Attribute = ConditionAttribute.Extension, Operator = ConditionOperator.Is, Value = "pdf" }
@@ -7,15 +7,16 @@ namespace FolderFresh.Tests.Conditions;
 /// <summary>
 /// Tests for Date conditions (DateCreated, DateModified, DateAccessed)
 /// </summary>
-public class DateConditionTests : IDisposable
+[Trait("Category", "FileSystem")]
+public class DateConditionTests : IClassFixture<RuleServiceFixture>, IDisposable
 {
     private readonly TestFileHelper _helper;
     private readonly RuleService _ruleService;
 
-    public DateConditionTests()
+    public DateConditionTests(RuleServiceFixture fixture)
     {
         _helper = new TestFileHelper();
-        _ruleService = new RuleService();
+        _ruleService = fixture.RuleService;
     }
 
     public void Dispose() => _helper.Dispose();
@@ -366,5 +367,22 @@ public class DateConditionTests : IDisposable
         Assert.False(result);  // Should return false for invalid date
     }
 
+    [Fact]
+    public void DateModified_IsBefore_EditedValueIsParsedAgain()
+    {
+        var file = _helper.CreateFileWithDates("test.txt", modifiedDate: new DateTime(2024, 6, 1));
+        var condition = new Condition
+        {
+            Attribute = ConditionAttribute.DateModified,
+            Operator = ConditionOperator.IsBefore,
+            Value = "2021-01-01"
+        };
+
+        Assert.False(_ruleService.EvaluateCondition(condition, file));
+
+        condition.Value = "2025-01-01";
+        Assert.True(_ruleService.EvaluateCondition(condition, file));
+    }
+
     #endregion
 }
@@ -7,15 +7,15 @@ namespace FolderFresh.Tests.Conditions;
 /// <summary>
 /// Tests for Kind condition (file type matching)
 /// </summary>
-public class KindConditionTests : IDisposable
+public class KindConditionTests : IClassFixture<RuleServiceFixture>, IDisposable
 {
     private readonly TestFileHelper _helper;
     private readonly RuleService _ruleService;
 
-    public KindConditionTests()
+    public KindConditionTests(RuleServiceFixture fixture)
     {
         _helper = new TestFileHelper();
-        _ruleService = new RuleService();
+        _ruleService = fixture.RuleService;
     }
 
     public void Dispose() => _helper.Dispose();
@@ -102,7 +102,7 @@ public class KindConditionTests : IDisposable
     [InlineData("file.unknown", "Other", true)]
     public void Kind_Is_MatchesCorrectFileType(string fileName, string expectedKind, bool expected)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Kind,
@@ -121,7 +121,7 @@ public class KindConditionTests : IDisposable
     [InlineData("photo.jpg", "Image", true)]  // mixed
     public void Kind_Is_CaseInsensitive(string fileName, string kindValue, bool expected)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Kind,
@@ -141,7 +141,7 @@ public class KindConditionTests : IDisposable
     [InlineData("movie.mp4", "Video", false)]
     public void Kind_IsNot_Works(string fileName, string kindValue, bool expected)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Kind,
@@ -159,7 +159,7 @@ public class KindConditionTests : IDisposable
     [InlineData("photo.Jpg", "Image")]  // mixed case extension
     public void Kind_ExtensionCaseInsensitive(string fileName, string expectedKind)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Kind,
@@ -7,7 +7,8 @@ namespace FolderFresh.Tests.Conditions;
 /// <summary>
 /// Tests for Size condition with various units (B, KB, MB, GB)
 /// </summary>
-public class SizeConditionTests : IDisposable
+[Trait("Category", "FileSystem")]
+public class SizeConditionTests : IClassFixture<RuleServiceFixture>, IDisposable
 {
     private readonly TestFileHelper _helper;
     private readonly RuleService _ruleService;
@@ -17,10 +18,10 @@ public class SizeConditionTests : IDisposable
     private const long MB = 1024 * 1024;
     private const long GB = 1024 * 1024 * 1024;
 
-    public SizeConditionTests()
+    public SizeConditionTests(RuleServiceFixture fixture)
     {
         _helper = new TestFileHelper();
-        _ruleService = new RuleService();
+        _ruleService = fixture.RuleService;
     }
 
     public void Dispose() => _helper.Dispose();
@@ -305,5 +306,26 @@ public class SizeConditionTests : IDisposable
         Assert.True(result);
     }
 
+    [Fact]
+    public void Size_EditedValueOrUnit_IsParsedAgain()
+    {
+        var file = _helper.CreateFile("test.txt", sizeInBytes: 2 * KB);
+        var condition = new Condition
+        {
+            Attribute = ConditionAttribute.Size,
+            Operator = ConditionOperator.IsGreaterThan,
+            Value = "1",
+            SecondaryValue = "KB"
+        };
+
+        Assert.True(_ruleService.EvaluateCondition(condition, file));
+
+        condition.Value = "3";
+        Assert.False(_ruleService.EvaluateCondition(condition, file));
+
+        condition.SecondaryValue = "B";
+        Assert.True(_ruleService.EvaluateCondition(condition, file));
+    }
+
     #endregion
 }
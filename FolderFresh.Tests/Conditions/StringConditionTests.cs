@@ -7,15 +7,15 @@ namespace FolderFresh.Tests.Conditions;
 /// <summary>
 /// Tests for string-based conditions: Name, Extension, FullName
 /// </summary>
-public class StringConditionTests : IDisposable
+public class StringConditionTests : IClassFixture<RuleServiceFixture>, IDisposable
 {
     private readonly TestFileHelper _helper;
     private readonly RuleService _ruleService;
 
-    public StringConditionTests()
+    public StringConditionTests(RuleServiceFixture fixture)
     {
         _helper = new TestFileHelper();
-        _ruleService = new RuleService();
+        _ruleService = fixture.RuleService;
     }
 
     public void Dispose() => _helper.Dispose();
@@ -30,7 +30,7 @@ public class StringConditionTests : IDisposable
     [InlineData("document1", "document", false)]
     public void Name_Is_MatchesExactly(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile($"{fileName}.pdf");
+        var file = _helper.GetFileInfo($"{fileName}.pdf");
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Name,
@@ -49,7 +49,7 @@ public class StringConditionTests : IDisposable
     [InlineData("Document", "document", false)]  // Case insensitive
     public void Name_IsNot_Works(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile($"{fileName}.pdf");
+        var file = _helper.GetFileInfo($"{fileName}.pdf");
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Name,
@@ -69,7 +69,7 @@ public class StringConditionTests : IDisposable
     [InlineData("my_document_2024", "xyz", false)]
     public void Name_Contains_Works(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile($"{fileName}.pdf");
+        var file = _helper.GetFileInfo($"{fileName}.pdf");
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Name,
@@ -87,7 +87,7 @@ public class StringConditionTests : IDisposable
     [InlineData("my_document_2024", "xyz", true)]
     public void Name_DoesNotContain_Works(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile($"{fileName}.pdf");
+        var file = _helper.GetFileInfo($"{fileName}.pdf");
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Name,
@@ -107,7 +107,7 @@ public class StringConditionTests : IDisposable
     [InlineData("document_2024", "2024", false)]
     public void Name_StartsWith_Works(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile($"{fileName}.pdf");
+        var file = _helper.GetFileInfo($"{fileName}.pdf");
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Name,
@@ -126,7 +126,7 @@ public class StringConditionTests : IDisposable
     [InlineData("document_2024", "doc", false)]
     public void Name_EndsWith_Works(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile($"{fileName}.pdf");
+        var file = _helper.GetFileInfo($"{fileName}.pdf");
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Name,
@@ -148,9 +148,11 @@ public class StringConditionTests : IDisposable
     [InlineData("document_2024", "xyz*", false)]
     [InlineData("file1", "file?", true)]
     [InlineData("file10", "file?", false)]  // ? only matches one char
+    [InlineData("document_2024", "DOCUMENT_2024", true)]  // No wildcards: whole-name match
+    [InlineData("document_2024", "document", false)]
     public void Name_MatchesPattern_Works(string fileName, string pattern, bool expected)
     {
-        var file = _helper.CreateFile($"{fileName}.pdf");
+        var file = _helper.GetFileInfo($"{fileName}.pdf");
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Name,
@@ -168,7 +170,7 @@ public class StringConditionTests : IDisposable
     {
         // Files can't really have empty names, but extension-only files like ".gitignore"
         // have an empty name when we strip the extension
-        var file = _helper.CreateFile(".gitignore");
+        var file = _helper.GetFileInfo(".gitignore");
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Name,
@@ -184,7 +186,7 @@ public class StringConditionTests : IDisposable
     [Fact]
     public void Name_IsNotBlank_Works()
     {
-        var file = _helper.CreateFile("document.pdf");
+        var file = _helper.GetFileInfo("document.pdf");
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Name,
@@ -209,7 +211,7 @@ public class StringConditionTests : IDisposable
     [InlineData("document.PDF", "pdf", true)]  // File extension is also case insensitive
     public void Extension_Is_MatchesExactly(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Extension,
@@ -225,9 +227,10 @@ public class StringConditionTests : IDisposable
     [Theory]
     [InlineData("document.pdf", "pdf", false)]
     [InlineData("document.pdf", "doc", true)]
+    [InlineData("document.PDF", ".pdf", false)]  // Dot and case are ignored
     public void Extension_IsNot_Works(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Extension,
@@ -246,7 +249,7 @@ public class StringConditionTests : IDisposable
     [InlineData("document.jpeg", "xyz", false)]
     public void Extension_Contains_Works(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Extension,
@@ -266,7 +269,7 @@ public class StringConditionTests : IDisposable
     [Fact]
     public void Folder_Is_MatchesAncestorFolder()
     {
-        var file = _helper.CreateFile(Path.Combine("radarr", "MovieName", "movie.mkv"));
+        var file = _helper.GetFileInfo(Path.Combine("radarr", "MovieName", "movie.mkv"));
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Folder,
@@ -282,7 +285,7 @@ public class StringConditionTests : IDisposable
     [Fact]
     public void Folder_IsNot_FalseWhenAncestorFolderMatches()
     {
-        var file = _helper.CreateFile(Path.Combine("radarr", "MovieName", "movie.mkv"));
+        var file = _helper.GetFileInfo(Path.Combine("radarr", "MovieName", "movie.mkv"));
         var condition = new Condition
         {
             Attribute = ConditionAttribute.Folder,
@@ -296,13 +299,14 @@ public class StringConditionTests : IDisposable
     }
 
     [Fact]
+    [Trait("Category", "FileSystem")]
     public void FolderPath_Is_MatchesAncestorFolderPath()
     {
         var ignoredFolder = _helper.CreateSubdirectory("radarr");
         var nestedFolder = Path.Combine(ignoredFolder, "MovieName");
         Directory.CreateDirectory(nestedFolder);
 
-        var file = _helper.CreateFile(Path.Combine("radarr", "MovieName", "movie.mkv"));
+        var file = _helper.GetFileInfo(Path.Combine("radarr", "MovieName", "movie.mkv"));
         var condition = new Condition
         {
             Attribute = ConditionAttribute.FolderPath,
@@ -325,7 +329,7 @@ public class StringConditionTests : IDisposable
     [InlineData("document.pdf", "document", false)]
     public void FullName_Is_MatchesExactly(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.FullName,
@@ -344,7 +348,7 @@ public class StringConditionTests : IDisposable
     [InlineData("my_file.txt", "_file", true)]
     public void FullName_Contains_Works(string fileName, string conditionValue, bool expected)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.FullName,
@@ -364,7 +368,7 @@ public class StringConditionTests : IDisposable
     [InlineData("report_2024.xlsx", "report_????.xlsx", true)]
     public void FullName_MatchesPattern_Works(string fileName, string pattern, bool expected)
     {
-        var file = _helper.CreateFile(fileName);
+        var file = _helper.GetFileInfo(fileName);
         var condition = new Condition
         {
             Attribute = ConditionAttribute.FullName,
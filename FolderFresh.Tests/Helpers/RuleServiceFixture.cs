@@ -0,0 +1,13 @@
+using FolderFresh.Services;
+
+namespace FolderFresh.Tests.Helpers;
+
+/// <summary>
+/// Shares a single RuleService across every test in a class.
+/// Tests only use the stateless matching/execution methods, so one instance is safe to reuse
+/// and avoids re-resolving the app data folder for each test.
+/// </summary>
+public class RuleServiceFixture
+{
+    public RuleService RuleService { get; } = new();
+}
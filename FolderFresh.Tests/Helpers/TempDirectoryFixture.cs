@@ -0,0 +1,43 @@
+namespace FolderFresh.Tests.Helpers;
+
+/// <summary>
+/// Shares one scratch directory across every test in a class.
+/// The directory is created once and removed after the last test, so tests that
+/// only need a file path don't each pay for creating and deleting a directory.
+/// Tests should use their own file names inside it (see <see cref="GetUniqueFilePath"/>).
+/// </summary>
+public class TempDirectoryFixture : IDisposable
+{
+    public string DirectoryPath { get; }
+
+    public TempDirectoryFixture()
+    {
+        DirectoryPath = Path.Combine(TestFileHelper.TestRoot, $"FolderFreshTests_{Guid.NewGuid():N}");
+        Directory.CreateDirectory(DirectoryPath);
+    }
+
+    /// <summary>
+    /// Returns a path in the shared directory that no other test uses
+    /// </summary>
+    public string GetUniqueFilePath(string fileName)
+    {
+        var name = Path.GetFileNameWithoutExtension(fileName);
+        var extension = Path.GetExtension(fileName);
+        return Path.Combine(DirectoryPath, $"{name}_{Guid.NewGuid():N}{extension}");
+    }
+
+    public void Dispose()
+    {
+        try
+        {
+            if (Directory.Exists(DirectoryPath))
+            {
+                Directory.Delete(DirectoryPath, true);
+            }
+        }
+        catch
+        {
+            // Ignore cleanup errors
+        }
+    }
+}
@@ -8,24 +8,78 @@ namespace FolderFresh.Tests.Helpers;
 /// </summary>
 public class TestFileHelper : IDisposable
 {
+    // Default file body as UTF-8 bytes (what WriteAllText would produce), encoded once
+    private static readonly byte[] DefaultContent = "test content"u8.ToArray();
+
     private readonly string _testDirectory;
     private readonly List<string> _createdFiles = new();
     private readonly List<string> _createdDirectories = new();
+    private bool _testDirectoryCreated;
 
-    public string TestDirectory => _testDirectory;
+    /// <summary>
+    /// Environment variable that overrides the root used for test directories
+    /// (e.g. point it at a RAM disk to keep test file I/O off the physical drive)
+    /// </summary>
+    public const string TestRootEnvironmentVariable = "FOLDERFRESH_TEST_ROOT";
+
+    /// <summary>
+    /// Root folder that all test directories are created under
+    /// </summary>
+    public static string TestRoot { get; } = ResolveTestRoot();
+
+    public string TestDirectory
+    {
+        get
+        {
+            EnsureTestDirectory();
+            return _testDirectory;
+        }
+    }
 
     public TestFileHelper()
     {
-        _testDirectory = Path.Combine(Path.GetTempPath(), "FolderFreshTests_" + Guid.NewGuid().ToString("N")[..8]);
-        Directory.CreateDirectory(_testDirectory);
+        // The folder itself is created on first use, so tests that only need
+        // path-based FileInfo objects (see GetFileInfo) never touch the disk
+        _testDirectory = Path.Combine(TestRoot, "FolderFreshTests_" + Guid.NewGuid().ToString("N")[..8]);
         _createdDirectories.Add(_testDirectory);
     }
 
+    private void EnsureTestDirectory()
+    {
+        if (_testDirectoryCreated)
+            return;
+
+        Directory.CreateDirectory(_testDirectory);
+        _testDirectoryCreated = true;
+    }
+
+    /// <summary>
+    /// Resolves the root folder for test directories, falling back to the system temp folder
+    /// </summary>
+    private static string ResolveTestRoot()
+    {
+        var root = Environment.GetEnvironmentVariable(TestRootEnvironmentVariable);
+        if (string.IsNullOrWhiteSpace(root))
+            return Path.GetTempPath();
+
+        try
+        {
+            Directory.CreateDirectory(root);
+            return root;
+        }
+        catch (Exception)
+        {
+            // Configured root is unusable - fall back to the temp folder
+            return Path.GetTempPath();
+        }
+    }
+
     /// <summary>
     /// Creates a test file with the specified name and optional content
     /// </summary>
     public FileInfo CreateFile(string fileName, string? content = null, long? sizeInBytes = null)
     {
+        EnsureTestDirectory();
         var filePath = Path.Combine(_testDirectory, fileName);
         var directory = Path.GetDirectoryName(filePath);
 
@@ -41,15 +95,29 @@ public class TestFileHelper : IDisposable
             using var fs = File.Create(filePath);
             fs.SetLength(sizeInBytes.Value);
         }
+        else if (content == null)
+        {
+            File.WriteAllBytes(filePath, DefaultContent);
+        }
         else
         {
-            File.WriteAllText(filePath, content ?? "test content");
+            File.WriteAllText(filePath, content);
         }
 
         _createdFiles.Add(filePath);
         return new FileInfo(filePath);
     }
 
+    /// <summary>
+    /// Gets a FileInfo for a path in the test folder without creating the file.
+    /// For tests that only look at the name, extension or folder, which FileInfo
+    /// derives from the path alone - no file write or stat is needed.
+    /// </summary>
+    public FileInfo GetFileInfo(string fileName)
+    {
+        return new FileInfo(Path.Combine(_testDirectory, fileName));
+    }
+
     /// <summary>
     /// Creates a test file with specific dates and optionally specific size
     /// </summary>
@@ -80,6 +148,7 @@ public class TestFileHelper : IDisposable
     /// </summary>
     public string CreateSubdirectory(string name)
     {
+        EnsureTestDirectory();
         var path = Path.Combine(_testDirectory, name);
         Directory.CreateDirectory(path);
         _createdDirectories.Add(path);
@@ -91,6 +160,7 @@ public class TestFileHelper : IDisposable
     /// </summary>
     public List<string> GetAllFiles()
     {
+        EnsureTestDirectory();
         return Directory.GetFiles(_testDirectory, "*", SearchOption.AllDirectories).ToList();
     }
 
@@ -99,6 +169,7 @@ public class TestFileHelper : IDisposable
     /// </summary>
     public Dictionary<string, string> GetFolderState()
     {
+        EnsureTestDirectory();
         var state = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
 
         foreach (var file in Directory.GetFiles(_testDirectory, "*", SearchOption.AllDirectories))
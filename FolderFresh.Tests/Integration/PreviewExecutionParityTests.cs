@@ -12,23 +12,26 @@ namespace FolderFresh.Tests.Integration;
 /// - Relative paths (e.g., "Documents") are combined with baseOutputPath
 /// - Absolute paths (e.g., "C:\Backup") are used as-is
 /// </summary>
-public class PreviewExecutionParityTests : IDisposable
+[Trait("Category", "FileSystem")]
+public class PreviewExecutionParityTests : IClassFixture<RuleServiceFixture>, IDisposable
 {
     private readonly TestFileHelper _helper;
     private readonly RuleService _ruleService;
 
-    public PreviewExecutionParityTests()
+    public PreviewExecutionParityTests(RuleServiceFixture fixture)
     {
         _helper = new TestFileHelper();
-        _ruleService = new RuleService();
+        _ruleService = fixture.RuleService;
     }
 
     public void Dispose() => _helper.Dispose();
 
     #region Move Action Parity
 
-    [Fact]
-    public async Task MoveToFolder_RelativePath_PreviewMatchesExecution()
+    [Theory]
+    [InlineData("Documents")]
+    [InlineData("NewFolder/Subfolder")]  // Nested folder that doesn't exist yet
+    public async Task MoveToFolder_RelativePath_PreviewMatchesExecution(string destinationFolder)
     {
         // Arrange
         var file = _helper.CreateFile("document.pdf");
@@ -37,7 +40,7 @@ public class PreviewExecutionParityTests : IDisposable
 
         // Use relative path - should be combined with basePath
         var rule = RuleBuilder.Create()
-            .WithMoveToFolder("Documents")
+            .WithMoveToFolder(destinationFolder)
             .Build();
 
         // Get preview prediction
@@ -46,9 +49,9 @@ public class PreviewExecutionParityTests : IDisposable
         var predictedPath = predictedPaths[0];
 
         // Verify preview shows correct combined path
-        Assert.Equal(Path.Combine(basePath, "Documents", "document.pdf"), predictedPath);
+        Assert.Equal(Path.Combine(basePath, destinationFolder, "document.pdf"), predictedPath);
 
-        // Execute
+        // Execute (creates the destination folder if needed)
         var result = await _ruleService.ExecuteActionsAsync(rule, file, basePath);
 
         // Verify parity
@@ -88,29 +91,6 @@ public class PreviewExecutionParityTests : IDisposable
         Assert.False(File.Exists(originalPath), $"Original file should no longer exist at: {originalPath}");
     }
 
-    [Fact]
-    public async Task MoveToFolder_CreatesDestinationFolder()
-    {
-        // Arrange
-        var file = _helper.CreateFile("document.pdf");
-        var basePath = _helper.TestDirectory;
-
-        // Use relative nested path - folder doesn't exist yet
-        var rule = RuleBuilder.Create()
-            .WithMoveToFolder("NewFolder/Subfolder")
-            .Build();
-
-        var predictedPaths = _ruleService.CalculateAllDestinationPaths(rule, file, basePath);
-        var predictedPath = predictedPaths[0];
-
-        // Execute
-        var result = await _ruleService.ExecuteActionsAsync(rule, file, basePath);
-
-        // Verify
-        Assert.True(result.Success);
-        Assert.True(File.Exists(predictedPath), $"File should exist at: {predictedPath}");
-    }
-
     #endregion
 
     #region Copy Action Parity
@@ -189,14 +169,13 @@ public class PreviewExecutionParityTests : IDisposable
         // Execute
         var result = await _ruleService.ExecuteActionsAsync(rule, file, basePath);
 
-        // Verify with detailed diagnostics
+        // Verify with detailed diagnostics (built once and shared by every assertion message)
         var allFiles = Directory.GetFiles(basePath, "*", SearchOption.AllDirectories);
-        var actionsTaken = string.Join(", ", result.ActionsTaken);
-        var filesInDir = string.Join(", ", allFiles.Select(Path.GetFileName));
+        var diagnostics = $"Actions: [{string.Join(", ", result.ActionsTaken)}]. Files: [{string.Join(", ", allFiles.Select(Path.GetFileName))}]";
 
-        Assert.True(result.Success, $"Execution failed. Errors: [{string.Join(", ", result.Errors)}]. Actions: [{actionsTaken}]. Files: [{filesInDir}]");
-        Assert.True(File.Exists(predictedPath), $"Renamed file should exist at: {predictedPath}. Actions: [{actionsTaken}]. Files: [{filesInDir}]");
-        Assert.False(File.Exists(originalPath), $"Original file should no longer exist at: {originalPath}. Actions: [{actionsTaken}]. Files: [{filesInDir}]");
+        Assert.True(result.Success, $"Execution failed. Errors: [{string.Join(", ", result.Errors)}]. {diagnostics}");
+        Assert.True(File.Exists(predictedPath), $"Renamed file should exist at: {predictedPath}. {diagnostics}");
+        Assert.False(File.Exists(originalPath), $"Original file should no longer exist at: {originalPath}. {diagnostics}");
     }
 
     [Fact]
@@ -222,42 +201,45 @@ public class PreviewExecutionParityTests : IDisposable
         Assert.Contains("document_2024-06-15.pdf", predictedPath);
     }
 
-    #endregion
-
-    #region SortIntoSubfolder Parity
-
     [Fact]
-    public async Task SortIntoSubfolder_PreviewMatchesExecution()
+    public async Task Rename_ToSameName_FileStaysInPlace()
     {
         // Arrange
-        var file = _helper.CreateFile("photo.jpg");
+        var file = _helper.CreateFile("document.pdf");
         var basePath = _helper.TestDirectory;
+        var originalPath = file.FullName;
 
         var rule = RuleBuilder.Create()
-            .WithSortIntoSubfolder("{Kind}")
+            .WithRename("{Name}.{ext}")
             .Build();
 
         var predictedPaths = _ruleService.CalculateAllDestinationPaths(rule, file, basePath);
-        var predictedPath = predictedPaths[0];
 
         // Execute
         var result = await _ruleService.ExecuteActionsAsync(rule, file, basePath);
 
-        // Verify
+        // Verify - no "document (1).pdf" from treating the file as its own conflict
         Assert.True(result.Success);
-        Assert.True(File.Exists(predictedPath), $"Sorted file should exist at: {predictedPath}");
-        Assert.Contains("Image", predictedPath);
+        Assert.Equal(originalPath, predictedPaths[0]);
+        Assert.True(File.Exists(originalPath));
+        Assert.Single(Directory.GetFiles(basePath));
     }
 
-    [Fact]
-    public async Task SortIntoSubfolder_NestedPattern_PreviewMatchesExecution()
+    #endregion
+
+    #region SortIntoSubfolder Parity
+
+    [Theory]
+    [InlineData("{Kind}", "Image")]
+    [InlineData("{Year}/{Month}/{Kind}", "2024/06/Image")]
+    public async Task SortIntoSubfolder_PreviewMatchesExecution(string pattern, string expectedSubfolder)
     {
         // Arrange
         var file = _helper.CreateFileWithDates("photo.jpg", modifiedDate: new DateTime(2024, 6, 15));
         var basePath = _helper.TestDirectory;
 
         var rule = RuleBuilder.Create()
-            .WithSortIntoSubfolder("{Year}/{Month}/{Kind}")
+            .WithSortIntoSubfolder(pattern)
             .Build();
 
         var predictedPaths = _ruleService.CalculateAllDestinationPaths(rule, file, basePath);
@@ -269,7 +251,7 @@ public class PreviewExecutionParityTests : IDisposable
         // Verify
         Assert.True(result.Success);
         Assert.True(File.Exists(predictedPath), $"Sorted file should exist at: {predictedPath}");
-        Assert.Contains(Path.Combine("2024", "06", "Image"), predictedPath);
+        Assert.Contains(expectedSubfolder.Replace('/', Path.DirectorySeparatorChar), predictedPath);
     }
 
     #endregion
@@ -378,15 +360,22 @@ public class PreviewExecutionParityTests : IDisposable
 
     #region Edge Cases
 
-    [Fact]
-    public async Task EmptyRule_NoChanges()
+    [Theory]
+    [InlineData(false)]  // Rule with no actions
+    [InlineData(true)]   // Rule with only an Ignore action
+    public async Task RuleWithoutMoves_FileStaysInPlace(bool ignore)
     {
         // Arrange
         var file = _helper.CreateFile("document.pdf");
         var basePath = _helper.TestDirectory;
         var originalPath = file.FullName;
 
-        var rule = RuleBuilder.Create().Build();  // No actions
+        var builder = RuleBuilder.Create();
+        if (ignore)
+        {
+            builder.WithIgnore();
+        }
+        var rule = builder.Build();
 
         var predictedPaths = _ruleService.CalculateAllDestinationPaths(rule, file, basePath);
 
@@ -396,33 +385,10 @@ public class PreviewExecutionParityTests : IDisposable
         // Verify
         Assert.Empty(predictedPaths);
         Assert.True(result.Success);
+        Assert.Equal(ignore, result.WasIgnored);
         Assert.True(File.Exists(originalPath), "File should remain at original location");
     }
 
-    [Fact]
-    public async Task Ignore_FileStaysInPlace()
-    {
-        // Arrange
-        var file = _helper.CreateFile("document.pdf");
-        var basePath = _helper.TestDirectory;
-        var originalPath = file.FullName;
-
-        var rule = RuleBuilder.Create()
-            .WithIgnore()
-            .Build();
-
-        var predictedPaths = _ruleService.CalculateAllDestinationPaths(rule, file, basePath);
-
-        // Execute
-        var result = await _ruleService.ExecuteActionsAsync(rule, file, basePath);
-
-        // Verify
-        Assert.Empty(predictedPaths);  // Ignore returns empty
-        Assert.True(result.Success);
-        Assert.True(result.WasIgnored);
-        Assert.True(File.Exists(originalPath), "Ignored file should stay in place");
-    }
-
     [Fact]
     public async Task Continue_DoesNotAffectFileLocation()
     {
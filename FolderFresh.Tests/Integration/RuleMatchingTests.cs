@@ -7,15 +7,16 @@ namespace FolderFresh.Tests.Integration;
 /// <summary>
 /// Integration tests for rule matching logic including priority, Continue action, and rule chaining.
 /// </summary>
-public class RuleMatchingTests : IDisposable
+[Trait("Category", "FileSystem")]
+public class RuleMatchingTests : IClassFixture<RuleServiceFixture>, IDisposable
 {
     private readonly TestFileHelper _helper;
     private readonly RuleService _ruleService;
 
-    public RuleMatchingTests()
+    public RuleMatchingTests(RuleServiceFixture fixture)
     {
         _helper = new TestFileHelper();
-        _ruleService = new RuleService();
+        _ruleService = fixture.RuleService;
     }
 
     public void Dispose() => _helper.Dispose();
@@ -221,6 +222,44 @@ public class RuleMatchingTests : IDisposable
         // Rule 3 should not be included
     }
 
+    [Fact]
+    public void GetMatchingRulesFromOrdered_PreparedOnce_MatchesPerFileOrdering()
+    {
+        var pdf = _helper.CreateFile("document.pdf");
+        var txt = _helper.CreateFile("notes.txt");
+
+        var backup = RuleBuilder.Create("Backup & Continue")
+            .WithCopyToFolder("Backup")
+            .WithContinue()
+            .WithPriority(1)
+            .Build();
+
+        var pdfRule = RuleBuilder.Create("PDFs")
+            .WithCondition(ConditionAttribute.Extension, ConditionOperator.Is, "pdf")
+            .WithMoveToFolder("PDFs")
+            .WithPriority(2)
+            .Build();
+
+        var disabled = RuleBuilder.Create("Disabled")
+            .WithMoveToFolder("Nowhere")
+            .WithPriority(0)
+            .Enabled(false)
+            .Build();
+
+        // Deliberately out of priority order
+        var rules = new List<Rule> { pdfRule, disabled, backup };
+        var orderedRules = RuleService.GetEnabledRulesByPriority(rules);
+
+        Assert.Equal(new[] { "Backup & Continue", "PDFs" }, orderedRules.Select(r => r.Name));
+
+        foreach (var file in new[] { pdf, txt })
+        {
+            var expected = _ruleService.GetMatchingRulesWithContinue(file, rules).Select(r => r.Name);
+            var actual = _ruleService.GetMatchingRulesFromOrdered(file, orderedRules).Select(r => r.Name);
+            Assert.Equal(expected, actual);
+        }
+    }
+
     [Fact]
     public void GetMatchingRulesWithContinue_OnlyMatchingRulesIncluded()
     {
@@ -451,10 +490,9 @@ public class RuleMatchingTests : IDisposable
             file.Refresh();
         }
 
-        // Verify all destinations (note: file may have been moved, so paths need adjustment)
-        // The copy should exist
-        Assert.True(File.Exists(allPredictedPaths[0]) || File.Exists(allPredictedPaths[1]),
-            "At least one destination should exist");
+        // Both destinations must exist: the copy made by the tagging rule and the moved original
+        Assert.True(File.Exists(allPredictedPaths[0]), $"Copy should exist at: {allPredictedPaths[0]}");
+        Assert.True(File.Exists(allPredictedPaths[1]), $"Moved file should exist at: {allPredictedPaths[1]}");
     }
 
     #endregion
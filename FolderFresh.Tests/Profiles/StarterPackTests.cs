@@ -1,8 +1,10 @@
 using System.Text.Json;
 using FolderFresh.Services;
+using FolderFresh.Tests.Helpers;
 
 namespace FolderFresh.Tests.Profiles;
 
+[Trait("Category", "FileSystem")]
 public class StarterPackTests
 {
     [Fact]
@@ -43,30 +45,21 @@ public class StarterPackTests
     [Fact]
     public async Task StarterPack_CanBeImportedAsReadableProfileFormat()
     {
-        var storageDirectory = Path.Combine(Path.GetTempPath(), $"FolderFreshStarterPack_{Guid.NewGuid():N}");
-        Directory.CreateDirectory(storageDirectory);
+        // TestFileHelper owns the scratch folder and removes it on dispose
+        using var helper = new TestFileHelper();
+        var storageDirectory = helper.TestDirectory;
 
-        try
-        {
-            var categoryService = new CategoryService(storageDirectory);
-            var ruleService = new RuleService(categoryService, storageDirectory);
-            var settingsService = new SettingsService(storageDirectory);
-            var profileService = new ProfileService(categoryService, ruleService, settingsService, storageDirectory);
-            var packPath = Path.Combine(AppContext.BaseDirectory, "StarterPacks", "clean-downloads.folderfresh");
+        var categoryService = new CategoryService(storageDirectory);
+        var ruleService = new RuleService(categoryService, storageDirectory);
+        var settingsService = new SettingsService(storageDirectory);
+        var profileService = new ProfileService(categoryService, ruleService, settingsService, storageDirectory);
+        var packPath = Path.Combine(AppContext.BaseDirectory, "StarterPacks", "clean-downloads.folderfresh");
 
-            var profile = await profileService.ImportProfileAsync(packPath);
+        var profile = await profileService.ImportProfileAsync(packPath);
 
-            Assert.Equal("Clean Downloads", profile.Name);
-            Assert.Contains("Documents and office files", profile.RulesJson);
-            Assert.Contains("\"confirmBeforeOrganize\": true", profile.SettingsJson);
-            Assert.Single(profileService.GetProfiles());
-        }
-        finally
-        {
-            if (Directory.Exists(storageDirectory))
-            {
-                Directory.Delete(storageDirectory, recursive: true);
-            }
-        }
+        Assert.Equal("Clean Downloads", profile.Name);
+        Assert.Contains("Documents and office files", profile.RulesJson);
+        Assert.Contains("\"confirmBeforeOrganize\": true", profile.SettingsJson);
+        Assert.Single(profileService.GetProfiles());
     }
 }
@@ -1,14 +1,17 @@
+using FolderFresh.Models;
 using FolderFresh.Services;
+using FolderFresh.Tests.Helpers;
 
 namespace FolderFresh.Tests.Services;
 
+[Trait("Category", "FileSystem")]
 public sealed class CategoryServiceTests : IDisposable
 {
     private readonly string _testCategoryDir;
 
     public CategoryServiceTests()
     {
-        _testCategoryDir = Path.Combine(Path.GetTempPath(), $"FolderFreshCategories_{Guid.NewGuid():N}");
+        _testCategoryDir = Path.Combine(TestFileHelper.TestRoot, $"FolderFreshCategories_{Guid.NewGuid():N}");
         Directory.CreateDirectory(_testCategoryDir);
     }
 
@@ -42,4 +45,59 @@ public sealed class CategoryServiceTests : IDisposable
         Assert.Contains(".md", reloadedDocuments.Extensions);
         Assert.Equal("documents", reloadedService.GetCategoryForFile(".md").Id);
     }
+
+    [Fact]
+    public async Task GetCategoryForFile_CustomCategoryTakesPrecedenceOverDefault()
+    {
+        var service = new CategoryService(_testCategoryDir);
+        await service.LoadCategoriesAsync();
+
+        Assert.Equal("documents", service.GetCategoryForFile("PDF").Id);
+
+        await service.AddCategoryAsync(new Category
+        {
+            Id = "invoices",
+            Name = "Invoices",
+            Extensions = new List<string> { ".pdf" },
+            Destination = "Invoices"
+        });
+
+        // The extension lookup is rebuilt after the category list changes
+        Assert.Equal("invoices", service.GetCategoryForFile(".pdf").Id);
+        Assert.Equal("other", service.GetCategoryForFile(".unknown").Id);
+        Assert.Equal("other", service.GetCategoryForFile(string.Empty).Id);
+    }
+
+    [Fact]
+    public void CategoryMatcher_SkipsDisabledCategoriesAndExposesFallback()
+    {
+        var categories = Category.GetDefaultCategories();
+        categories.Single(category => category.Id == "images").IsEnabled = false;
+
+        var matcher = new CategoryMatcher(categories);
+
+        Assert.Null(matcher.FindByExtension(".png"));
+        Assert.Equal("documents", matcher.FindByExtension("pdf")?.Id);
+        Assert.Equal("other", matcher.Fallback?.Id);
+    }
+
+    [Fact]
+    public async Task ReplaceCategoriesAsync_InMemoryStateMatchesReloadFromDisk()
+    {
+        var service = new CategoryService(_testCategoryDir);
+        var categories = Category.GetDefaultCategories();
+        var documents = categories.Single(category => category.Id == "documents");
+        documents.Extensions.RemoveAll(extension => extension == ".odt");
+
+        await service.ReplaceCategoriesAsync(categories);
+
+        // Same fix-ups as a load, without reading the file back
+        Assert.Contains(".odt", service.GetCategories().Single(category => category.Id == "documents").Extensions);
+
+        var reloadedService = new CategoryService(_testCategoryDir);
+        var reloaded = await reloadedService.LoadCategoriesAsync();
+        Assert.Equal(
+            service.GetCategories().Select(category => category.Id),
+            reloaded.Select(category => category.Id));
+    }
 }
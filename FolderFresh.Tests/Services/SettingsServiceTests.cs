@@ -1,6 +1,7 @@
 using System.Text.Json;
 using FolderFresh.Models;
 using FolderFresh.Services;
+using FolderFresh.Tests.Helpers;
 
 namespace FolderFresh.Tests.Services;
 
@@ -8,26 +9,17 @@ namespace FolderFresh.Tests.Services;
 /// Tests for SettingsService - verifies settings are properly loaded, saved, and persisted.
 /// These tests ensure the settings toggles in the UI will work correctly.
 /// </summary>
-public class SettingsServiceTests : IDisposable
+[Trait("Category", "FileSystem")]
+public class SettingsServiceTests : IClassFixture<TempDirectoryFixture>
 {
     private readonly string _testSettingsDir;
     private readonly string _testSettingsPath;
 
-    public SettingsServiceTests()
+    public SettingsServiceTests(TempDirectoryFixture fixture)
     {
-        // Create a unique test directory for each test run
-        _testSettingsDir = Path.Combine(Path.GetTempPath(), $"FolderFreshTests_{Guid.NewGuid()}");
-        Directory.CreateDirectory(_testSettingsDir);
-        _testSettingsPath = Path.Combine(_testSettingsDir, "settings.json");
-    }
-
-    public void Dispose()
-    {
-        // Clean up test directory
-        if (Directory.Exists(_testSettingsDir))
-        {
-            Directory.Delete(_testSettingsDir, true);
-        }
+        // The directory is shared by the whole class; each test gets its own settings file in it
+        _testSettingsDir = fixture.DirectoryPath;
+        _testSettingsPath = fixture.GetUniqueFilePath("settings.json");
     }
 
     #region Default Settings Tests
@@ -358,55 +350,4 @@ public class SettingsServiceTests : IDisposable
     }
 
     #endregion
-
-    #region Settings Combination Validation
-
-    [Fact]
-    public void RulesFirstMode_HasCorrectSettingsCombination()
-    {
-        // "Rules first, then categories" mode
-        var settings = new AppSettings
-        {
-            UseRulesFirst = true,
-            FallbackToCategories = true
-        };
-
-        // In this mode, rules are evaluated first
-        // If no rule matches, categories are used as fallback
-        Assert.True(settings.UseRulesFirst);
-        Assert.True(settings.FallbackToCategories);
-    }
-
-    [Fact]
-    public void CategoriesOnlyMode_HasCorrectSettingsCombination()
-    {
-        // "Categories only" mode
-        var settings = new AppSettings
-        {
-            UseRulesFirst = false,
-            FallbackToCategories = true
-        };
-
-        // In this mode, only categories are used
-        Assert.False(settings.UseRulesFirst);
-        Assert.True(settings.FallbackToCategories);
-    }
-
-    [Fact]
-    public void RulesOnlyMode_HasCorrectSettingsCombination()
-    {
-        // "Rules only" mode
-        var settings = new AppSettings
-        {
-            UseRulesFirst = true,
-            FallbackToCategories = false
-        };
-
-        // In this mode, only rules are used
-        // Files that don't match any rule are not organized
-        Assert.True(settings.UseRulesFirst);
-        Assert.False(settings.FallbackToCategories);
-    }
-
-    #endregion
 }
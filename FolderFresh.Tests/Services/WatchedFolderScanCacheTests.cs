@@ -0,0 +1,143 @@
+using FolderFresh.Models;
+using FolderFresh.Services;
+using FolderFresh.Tests.Helpers;
+
+namespace FolderFresh.Tests.Services;
+
+[Trait("Category", "FileSystem")]
+public sealed class WatchedFolderScanCacheTests : IDisposable
+{
+    private const string FolderId = "watched-folder";
+
+    private readonly TestFileHelper _helper;
+    private readonly List<Rule> _rules;
+    private readonly List<Category> _categories;
+    private readonly AppSettings _settings;
+
+    public WatchedFolderScanCacheTests()
+    {
+        _helper = new TestFileHelper();
+        _rules = new List<Rule>
+        {
+            RuleBuilder.Create("PDFs")
+                .WithCondition(ConditionAttribute.Extension, ConditionOperator.Is, "pdf")
+                .WithMoveToFolder("Documents")
+                .Build()
+        };
+        _categories = Category.GetDefaultCategories();
+        _settings = new AppSettings();
+    }
+
+    public void Dispose()
+    {
+        _helper.Dispose();
+    }
+
+    private string? Signature(List<Category>? sharedCategories = null) =>
+        WatchedFolderScanCache.GetConfigurationSignature(_rules, _categories, _settings, sharedCategories ?? _categories);
+
+    private static WatchedFolderScanCache.Scan RecordScan(WatchedFolderScanCache cache, string signature, params FileInfo[] files)
+    {
+        var scan = cache.BeginScan(FolderId, signature)!;
+        foreach (var file in files)
+        {
+            scan.RecordUnchanged(file);
+        }
+        cache.CompleteScan(FolderId, scan);
+        return scan;
+    }
+
+    [Fact]
+    public void TryReuse_UnchangedFileWithSameConfiguration_IsSkipped()
+    {
+        var cache = new WatchedFolderScanCache();
+        var file = _helper.CreateFile("notes.txt", "hello");
+        var signature = Signature()!;
+        RecordScan(cache, signature, file);
+
+        var nextScan = cache.BeginScan(FolderId, signature)!;
+
+        Assert.True(nextScan.TryReuse(_helper.GetFileInfo("notes.txt")));
+    }
+
+    [Fact]
+    public void TryReuse_ModifiedFile_IsEvaluatedAgain()
+    {
+        var cache = new WatchedFolderScanCache();
+        var file = _helper.CreateFile("notes.txt", "hello");
+        var signature = Signature()!;
+        RecordScan(cache, signature, file);
+
+        File.AppendAllText(file.FullName, " world");
+        var nextScan = cache.BeginScan(FolderId, signature)!;
+
+        Assert.False(nextScan.TryReuse(_helper.GetFileInfo("notes.txt")));
+    }
+
+    [Fact]
+    public void TryReuse_AfterRuleChange_IsEvaluatedAgain()
+    {
+        var cache = new WatchedFolderScanCache();
+        var file = _helper.CreateFile("notes.txt", "hello");
+        RecordScan(cache, Signature()!, file);
+
+        _rules[0].Actions[0].Value = "Papers";
+        var nextScan = cache.BeginScan(FolderId, Signature())!;
+
+        Assert.False(nextScan.TryReuse(_helper.GetFileInfo("notes.txt")));
+    }
+
+    [Fact]
+    public void TryReuse_AfterSharedCategoryEdit_IsEvaluatedAgain()
+    {
+        // A folder watched under another profile still reads the category service's categories
+        var cache = new WatchedFolderScanCache();
+        var sharedCategories = Category.GetDefaultCategories();
+        var file = _helper.CreateFile("notes.txt", "hello");
+        RecordScan(cache, Signature(sharedCategories)!, file);
+
+        sharedCategories[0].Destination = "Elsewhere";
+        var nextScan = cache.BeginScan(FolderId, Signature(sharedCategories))!;
+
+        Assert.False(nextScan.TryReuse(_helper.GetFileInfo("notes.txt")));
+    }
+
+    [Fact]
+    public void GetConfigurationSignature_DateCondition_DisablesCache()
+    {
+        var cache = new WatchedFolderScanCache();
+        var file = _helper.CreateFile("notes.txt", "hello");
+        RecordScan(cache, Signature()!, file);
+
+        _rules.Add(RuleBuilder.Create("Old files")
+            .WithCondition(ConditionAttribute.DateModified, ConditionOperator.IsBefore, "2020-01-01")
+            .WithMoveToFolder("Archive")
+            .Build());
+        var signature = Signature();
+
+        Assert.Null(signature);
+        Assert.Null(cache.BeginScan(FolderId, signature));
+
+        // The folder's entries were dropped, so a later cacheable run starts fresh
+        _rules.RemoveAt(1);
+        Assert.False(cache.BeginScan(FolderId, Signature())!.TryReuse(_helper.GetFileInfo("notes.txt")));
+    }
+
+    [Fact]
+    public void CompleteScan_FileNotSeenInLatestScan_DropsOut()
+    {
+        var cache = new WatchedFolderScanCache();
+        var kept = _helper.CreateFile("kept.txt", "hello");
+        var moved = _helper.CreateFile("moved.txt", "hello");
+        var signature = Signature()!;
+        RecordScan(cache, signature, kept, moved);
+
+        var secondScan = cache.BeginScan(FolderId, signature)!;
+        Assert.True(secondScan.TryReuse(_helper.GetFileInfo("kept.txt")));
+        cache.CompleteScan(FolderId, secondScan);
+
+        var thirdScan = cache.BeginScan(FolderId, signature)!;
+        Assert.True(thirdScan.TryReuse(_helper.GetFileInfo("kept.txt")));
+        Assert.False(thirdScan.TryReuse(_helper.GetFileInfo("moved.txt")));
+    }
+}
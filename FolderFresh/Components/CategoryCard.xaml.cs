@@ -14,6 +14,10 @@ public sealed partial class CategoryCard : UserControl
 {
     private const int MaxVisibleExtensions = 8;
 
+    // Shared by every card so hover updates don't allocate new brushes
+    private static readonly SolidColorBrush HoverIconBrush = new(Color.FromArgb(255, 153, 153, 153)); // #999999
+    private static readonly SolidColorBrush MutedIconBrush = new(Color.FromArgb(255, 102, 102, 102)); // #666666
+
     public static readonly DependencyProperty CategoryProperty =
         DependencyProperty.Register(
             nameof(Category),
@@ -154,7 +158,7 @@ public sealed partial class CategoryCard : UserControl
     {
         if (sender is Button button && button.Content is FontIcon icon)
         {
-            icon.Foreground = new SolidColorBrush(Color.FromArgb(255, 153, 153, 153)); // #999999
+            icon.Foreground = HoverIconBrush;
         }
     }
 
@@ -162,7 +166,7 @@ public sealed partial class CategoryCard : UserControl
     {
         if (sender is Button button && button.Content is FontIcon icon)
         {
-            icon.Foreground = new SolidColorBrush(Color.FromArgb(255, 102, 102, 102)); // #666666
+            icon.Foreground = MutedIconBrush;
         }
     }
 
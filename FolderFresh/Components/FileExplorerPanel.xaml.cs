@@ -32,6 +32,10 @@ public sealed partial class FileExplorerPanel : UserControl
     private ObservableCollection<FileItem>? _sourceCollection;
     private readonly ObservableCollection<FileItem> _sortedItems = new();
 
+    // Row hover brushes, shared instead of allocated on every pointer event
+    private static readonly SolidColorBrush RowHoverBrush = new(Windows.UI.Color.FromArgb(60, 255, 255, 255));
+    private static readonly SolidColorBrush RowIdleBrush = new(Colors.Transparent);
+
     public FileExplorerPanel()
     {
         this.InitializeComponent();
@@ -305,7 +309,7 @@ public sealed partial class FileExplorerPanel : UserControl
     {
         if (sender is Grid grid)
         {
-            grid.Background = new SolidColorBrush(Windows.UI.Color.FromArgb(60, 255, 255, 255));
+            grid.Background = RowHoverBrush;
         }
     }
 
@@ -313,7 +317,7 @@ public sealed partial class FileExplorerPanel : UserControl
     {
         if (sender is Grid grid)
         {
-            grid.Background = new SolidColorBrush(Colors.Transparent);
+            grid.Background = RowIdleBrush;
         }
     }
 
@@ -17,6 +17,14 @@ public sealed partial class RuleCard : UserControl
     private Rule? _rule;
     private int _matchCount;
 
+    // Shared by every card so hover and match-count updates don't allocate new brushes
+    private static readonly SolidColorBrush MutedBrush = new(Microsoft.UI.ColorHelper.FromArgb(255, 102, 102, 102));
+    private static readonly SolidColorBrush AccentBrush = new(Microsoft.UI.ColorHelper.FromArgb(255, 96, 205, 255));
+    private static readonly SolidColorBrush HoverBorderBrush = new(Microsoft.UI.ColorHelper.FromArgb(102, 96, 205, 255)); // 40% opacity
+    private static readonly SolidColorBrush IdleBorderBrush = new(Microsoft.UI.ColorHelper.FromArgb(255, 51, 51, 51));
+    private static readonly SolidColorBrush HoverIconBrush = new(Microsoft.UI.ColorHelper.FromArgb(255, 153, 153, 153));
+    private static readonly SolidColorBrush DeleteHoverBrush = new(Microsoft.UI.ColorHelper.FromArgb(255, 239, 68, 68));
+
     public event EventHandler<Rule>? EditRequested;
     public event EventHandler<Rule>? DeleteRequested;
     public event EventHandler<Rule>? EnabledChanged;
@@ -67,12 +75,12 @@ public sealed partial class RuleCard : UserControl
         if (_matchCount == 0)
         {
             MatchCountText.Text = Loc.Get("RuleCard_NoMatches");
-            MatchCountText.Foreground = new SolidColorBrush(Microsoft.UI.ColorHelper.FromArgb(255, 102, 102, 102));
+            MatchCountText.Foreground = MutedBrush;
         }
         else
         {
             MatchCountText.Text = _matchCount == 1 ? Loc.Get("RuleCard_OneFile") : Loc.Get("RuleCard_Files", _matchCount);
-            MatchCountText.Foreground = new SolidColorBrush(Microsoft.UI.ColorHelper.FromArgb(255, 96, 205, 255));
+            MatchCountText.Foreground = AccentBrush;
         }
     }
 
@@ -216,32 +224,32 @@ public sealed partial class RuleCard : UserControl
 
     private void CardBorder_PointerEntered(object sender, PointerRoutedEventArgs e)
     {
-        CardBorder.BorderBrush = new SolidColorBrush(Microsoft.UI.ColorHelper.FromArgb(102, 96, 205, 255)); // 40% opacity
+        CardBorder.BorderBrush = HoverBorderBrush;
     }
 
     private void CardBorder_PointerExited(object sender, PointerRoutedEventArgs e)
     {
-        CardBorder.BorderBrush = new SolidColorBrush(Microsoft.UI.ColorHelper.FromArgb(255, 51, 51, 51));
+        CardBorder.BorderBrush = IdleBorderBrush;
     }
 
     private void ActionButton_PointerEntered(object sender, PointerRoutedEventArgs e)
     {
-        EditIcon.Foreground = new SolidColorBrush(Microsoft.UI.ColorHelper.FromArgb(255, 153, 153, 153));
+        EditIcon.Foreground = HoverIconBrush;
     }
 
     private void ActionButton_PointerExited(object sender, PointerRoutedEventArgs e)
     {
-        EditIcon.Foreground = new SolidColorBrush(Microsoft.UI.ColorHelper.FromArgb(255, 102, 102, 102));
+        EditIcon.Foreground = MutedBrush;
     }
 
     private void DeleteButton_PointerEntered(object sender, PointerRoutedEventArgs e)
     {
-        DeleteIcon.Foreground = new SolidColorBrush(Microsoft.UI.ColorHelper.FromArgb(255, 239, 68, 68));
+        DeleteIcon.Foreground = DeleteHoverBrush;
     }
 
     private void DeleteButton_PointerExited(object sender, PointerRoutedEventArgs e)
     {
-        DeleteIcon.Foreground = new SolidColorBrush(Microsoft.UI.ColorHelper.FromArgb(255, 102, 102, 102));
+        DeleteIcon.Foreground = MutedBrush;
     }
 
     private void EnabledToggle_Toggled(object sender, RoutedEventArgs e)
@@ -294,9 +294,7 @@ public sealed partial class WatchedFolderPreviewDialog : ContentDialog
         var reason = file.MatchedBy switch
         {
             OrganizeMatchType.Rule => BuildRuleReason(file),
-            OrganizeMatchType.Category => string.IsNullOrWhiteSpace(file.Extension)
-                ? $"No extension matched category {file.MatchedCategoryName ?? "Unknown"}"
-                : $"Extension {file.Extension} matched category {file.MatchedCategoryName ?? "Unknown"}",
+            OrganizeMatchType.Category => BuildCategoryReason(file),
             _ => isIgnored ? "Ignored by rule or no safe destination found" : "No organization match found"
         };
 
@@ -306,6 +304,17 @@ public sealed partial class WatchedFolderPreviewDialog : ContentDialog
         return $"Matched: {matched}{Environment.NewLine}Reason: {reason}{Environment.NewLine}Action: {action}{Environment.NewLine}Safety: {safety}";
     }
 
+    private static string BuildCategoryReason(FileOrganizeResult file)
+    {
+        // Resolve the display name and extension once instead of per branch
+        var categoryName = file.MatchedCategoryName ?? "Unknown";
+        var extension = file.Extension;
+
+        return string.IsNullOrWhiteSpace(extension)
+            ? $"No extension matched category {categoryName}"
+            : $"Extension {extension} matched category {categoryName}";
+    }
+
     private static string BuildRuleReason(FileOrganizeResult file)
     {
         var firstRule = file.MatchedRules.FirstOrDefault();
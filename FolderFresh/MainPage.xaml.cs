@@ -958,7 +958,8 @@ public sealed partial class MainPage : Page
         await _ruleService.LoadRulesAsync();
         var settings = _settingsService.GetSettings();
         var allCategories = _categoryService.GetCategories();
-        var rules = _ruleService.GetRules();
+        // Filter and sort the rules once for the whole scan rather than per file
+        var rules = RuleService.GetEnabledRulesByPriority(_ruleService.GetRules());
         var folderPath = _selectedFolder.Path;
 
         // Create the new organize preview
@@ -974,25 +975,24 @@ public sealed partial class MainPage : Page
         // Process files on background thread to avoid UI freeze
         await Task.Run(() =>
         {
-            // Get files in the root folder
-            string[] rootFiles;
+            // Get files in the root folder (FileInfo entries come back with attributes,
+            // size and timestamps already populated from the directory listing)
+            FileInfo[] rootFiles;
             try
             {
-                rootFiles = Directory.GetFiles(folderPath);
+                rootFiles = new DirectoryInfo(folderPath).GetFiles();
             }
             catch
             {
-                rootFiles = Array.Empty<string>();
+                rootFiles = Array.Empty<FileInfo>();
             }
 
-            foreach (var filePath in rootFiles)
+            foreach (var fileInfo in rootFiles)
             {
                 if (processedCount >= maxPreviewFiles) break;
 
                 try
                 {
-                    var fileInfo = new FileInfo(filePath);
-
                     // Skip hidden/system files based on settings
                     if (ShouldSkipFile(fileInfo, settings)) continue;
 
@@ -1026,9 +1026,10 @@ public sealed partial class MainPage : Page
         };
 
         // Step 1: Try rules first (if enabled)
-        if (settings.UseRulesFirst && rules.Any(r => r.IsEnabled))
+        // Rules are already filtered to enabled rules in priority order
+        if (settings.UseRulesFirst && rules.Count > 0)
         {
-            var matchingRules = _ruleService.GetMatchingRulesWithContinue(fileInfo, rules);
+            var matchingRules = _ruleService.GetMatchingRulesFromOrdered(fileInfo, rules);
             if (matchingRules.Count > 0)
             {
                 // Collect all actions from all matching rules
@@ -1183,18 +1184,17 @@ public sealed partial class MainPage : Page
 
                 // Get relative path from base folder for display purposes
                 var relativePath = Path.GetRelativePath(baseFolderPath, subFolderPath);
-                var filesInSubfolder = Directory.GetFiles(subFolderPath);
+                var filesInSubfolder = dirInfo.GetFiles();
                 var hasIgnoredFiles = false;
+                var hasProcessableFiles = false;
 
-                foreach (var filePath in filesInSubfolder)
+                foreach (var fileInfo in filesInSubfolder)
                 {
                     // Early exit if we've hit the file limit
                     if (processedCount >= maxFiles) return;
 
                     try
                     {
-                        var fileInfo = new FileInfo(filePath);
-
                         // Check if file should be skipped (hidden/system)
                         if (ShouldSkipFile(fileInfo, settings))
                         {
@@ -1205,6 +1205,7 @@ public sealed partial class MainPage : Page
                             continue;
                         }
 
+                        hasProcessableFiles = true;
                         ProcessFileForPreview(fileInfo, baseFolderPath, settings, rules, allCategories, isInRoot: false, sourceSubfolder: relativePath);
                         processedCount++;
                     }
@@ -1217,20 +1218,10 @@ public sealed partial class MainPage : Page
 
                 // If folder only has ignored files (no processable files were added),
                 // ensure the folder still shows in preview
-                if (hasIgnoredFiles)
+                if (hasIgnoredFiles && !hasProcessableFiles)
                 {
-                    try
-                    {
-                        if (!filesInSubfolder.Any(f => !ShouldSkipFile(new FileInfo(f), settings)))
-                        {
-                            // Folder will remain because it only contains ignored files
-                            EnsureFolderInPreview(relativePath);
-                        }
-                    }
-                    catch
-                    {
-                        // Ignore errors checking for ignored files
-                    }
+                    // Folder will remain because it only contains ignored files
+                    EnsureFolderInPreview(relativePath);
                 }
 
                 // Recursively scan nested subfolders
@@ -1792,7 +1783,8 @@ public sealed partial class MainPage : Page
         if (_isOperationInProgress) return;
 
         var settings = _settingsService.GetSettings();
-        var rules = _ruleService.GetRules();
+        // Filter and sort the rules once for the whole run rather than per file
+        var rules = RuleService.GetEnabledRulesByPriority(_ruleService.GetRules());
         var allCategories = _categoryService.GetCategories();
         var folderPath = selectedFolder.Path;
 
@@ -1948,9 +1940,10 @@ public sealed partial class MainPage : Page
         };
 
         // Step 1: Try rules first (if enabled)
-        if (settings.UseRulesFirst && rules.Any(r => r.IsEnabled))
+        // Rules are already filtered to enabled rules in priority order
+        if (settings.UseRulesFirst && rules.Count > 0)
         {
-            var matchingRules = _ruleService.GetMatchingRulesWithContinue(fileInfo, rules);
+            var matchingRules = _ruleService.GetMatchingRulesFromOrdered(fileInfo, rules);
             if (matchingRules.Count > 0)
             {
                 var allActions = new List<RuleAction>();
@@ -2149,24 +2142,41 @@ public sealed partial class MainPage : Page
         // Track if file was deleted
         var fileWasDeleted = false;
 
-        foreach (var action in result.Actions)
+        // New name from a Rename that the following move action applies
+        string? pendingName = null;
+
+        var actions = result.Actions;
+        for (var i = 0; i < actions.Count; i++)
         {
+            var action = actions[i];
             switch (action.Type)
             {
                 case ActionType.MoveToFolder:
+                case ActionType.MoveToCategory:
+                case ActionType.SortIntoSubfolder:
                     {
-                        var destFolder = action.Value;
-                        if (!Path.IsPathRooted(destFolder))
-                        {
-                            destFolder = Path.Combine(baseFolderPath, destFolder);
-                        }
-                        var targetPath = Path.Combine(destFolder, currentFileName);
+                        var destFolder = RuleService.ResolveMoveDestinationFolder(action, originalFileInfo, baseFolderPath, _categoryService);
+                        if (destFolder == null)
+                            break;
+
+                        // A directly preceding Rename is applied here, in the same File.Move
+                        var targetPath = Path.Combine(destFolder, pendingName ?? currentFileName);
+                        pendingName = null;
 
                         // Skip if already in destination
                         if (currentFilePath.Equals(targetPath, StringComparison.OrdinalIgnoreCase))
                             break;
 
-                        Directory.CreateDirectory(destFolder);
+                        if (action.Type == ActionType.SortIntoSubfolder)
+                        {
+                            // Track which folders we create for undo
+                            allCreatedFolders.AddRange(CreateDirectoryAndTrack(destFolder, baseFolderPath));
+                        }
+                        else
+                        {
+                            Directory.CreateDirectory(destFolder);
+                        }
+
                         var destPath = GetUniqueFilePath(targetPath, currentFilePath);
                         File.Move(currentFilePath, destPath);
 
@@ -2200,62 +2210,18 @@ public sealed partial class MainPage : Page
                     }
                     break;
 
-                case ActionType.MoveToCategory:
-                    {
-                        var categoryId = action.Value;
-                        var category = _categoryService.GetCategories().FirstOrDefault(c => c.Id == categoryId);
-                        if (category != null)
-                        {
-                            var destFolder = Path.IsPathRooted(category.Destination)
-                                ? category.Destination
-                                : Path.Combine(baseFolderPath, category.Destination);
-                            var targetPath = Path.Combine(destFolder, currentFileName);
-
-                            // Skip if already in destination
-                            if (currentFilePath.Equals(targetPath, StringComparison.OrdinalIgnoreCase))
-                                break;
-
-                            Directory.CreateDirectory(destFolder);
-                            var destPath = GetUniqueFilePath(targetPath, currentFilePath);
-                            File.Move(currentFilePath, destPath);
-
-                            // Update current file location
-                            currentFilePath = destPath;
-                            currentFileName = Path.GetFileName(destPath);
-                            currentDirectory = destFolder;
-                        }
-                    }
-                    break;
-
-                case ActionType.SortIntoSubfolder:
+                case ActionType.Rename:
                     {
-                        var subfolderName = RuleService.ExpandPattern(action.Value, originalFileInfo, _categoryService);
-                        // Normalize path separators (user might use / in pattern)
-                        subfolderName = subfolderName.Replace('/', Path.DirectorySeparatorChar);
-                        var destFolder = Path.Combine(baseFolderPath, subfolderName);
-                        var targetPath = Path.Combine(destFolder, currentFileName);
+                        var newName = RuleService.ExpandPattern(action.Value, originalFileInfo, _categoryService);
 
-                        // Skip if already in destination
-                        if (currentFilePath.Equals(targetPath, StringComparison.OrdinalIgnoreCase))
+                        // Rename followed by a move to another folder: the move applies the new name
+                        // in a single File.Move instead of renaming in place first
+                        if (RuleService.IsRenameFollowedByMove(actions, i, originalFileInfo, baseFolderPath, currentDirectory, _categoryService))
+                        {
+                            pendingName = newName;
                             break;
+                        }
 
-                        // Track which folders we create for undo
-                        var createdFolders = CreateDirectoryAndTrack(destFolder, baseFolderPath);
-                        allCreatedFolders.AddRange(createdFolders);
-
-                        var destPath = GetUniqueFilePath(targetPath, currentFilePath);
-                        File.Move(currentFilePath, destPath);
-
-                        // Update current file location
-                        currentFilePath = destPath;
-                        currentFileName = Path.GetFileName(destPath);
-                        currentDirectory = destFolder;
-                    }
-                    break;
-
-                case ActionType.Rename:
-                    {
-                        var newName = RuleService.ExpandPattern(action.Value, originalFileInfo, _categoryService);
                         var targetPath = Path.Combine(currentDirectory, newName);
 
                         // Skip if the name is exactly the same (case-sensitive)
@@ -2376,10 +2342,11 @@ public sealed partial class MainPage : Page
                !currentDir.Equals(basePath, StringComparison.OrdinalIgnoreCase) &&
                currentDir.StartsWith(basePath, StringComparison.OrdinalIgnoreCase))
         {
-            if (!Directory.Exists(currentDir))
-            {
-                directoriesToCreate.Add(currentDir);
-            }
+            // Once a folder exists, all of its parents do too
+            if (Directory.Exists(currentDir))
+                break;
+
+            directoriesToCreate.Add(currentDir);
             currentDir = Path.GetDirectoryName(currentDir);
         }
 
@@ -2387,12 +2354,9 @@ public sealed partial class MainPage : Page
         directoriesToCreate.Reverse();
         foreach (var dir in directoriesToCreate)
         {
-            if (!Directory.Exists(dir))
-            {
-                Directory.CreateDirectory(dir);
-                // Store in reverse order (innermost first) for deletion during undo
-                createdFolders.Insert(0, dir);
-            }
+            Directory.CreateDirectory(dir);
+            // Store in reverse order (innermost first) for deletion during undo
+            createdFolders.Insert(0, dir);
         }
 
         return createdFolders;
@@ -2438,6 +2402,10 @@ public sealed partial class MainPage : Page
         // Collect all created folders for cleanup (innermost first)
         var allCreatedFolders = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
 
+        // Folder handles resolved during this undo pass - a batch usually moves many files
+        // between the same few folders, so each folder is only looked up (and created) once
+        var folderCache = new Dictionary<string, StorageFolder>(StringComparer.OrdinalIgnoreCase);
+
         try
         {
             // Process in reverse order (LIFO) to handle any dependencies
@@ -2493,17 +2461,21 @@ public sealed partial class MainPage : Page
                 try
                 {
                     // Get the file from its current location
-                    var currentFolder = await StorageFolder.GetFolderFromPathAsync(op.NewFolderPath);
+                    if (!folderCache.TryGetValue(op.NewFolderPath, out var currentFolder))
+                    {
+                        currentFolder = await StorageFolder.GetFolderFromPathAsync(op.NewFolderPath);
+                        folderCache[op.NewFolderPath] = currentFolder;
+                    }
                     var file = await currentFolder.GetFileAsync(op.NewFileName);
 
                     // Ensure the original folder exists (it may have been deleted or cleaned up)
                     // Create the folder hierarchy if it doesn't exist
-                    StorageFolder originalFolder;
-                    if (!Directory.Exists(op.OriginalFolderPath))
+                    if (!folderCache.TryGetValue(op.OriginalFolderPath, out var originalFolder))
                     {
                         Directory.CreateDirectory(op.OriginalFolderPath);
+                        originalFolder = await StorageFolder.GetFolderFromPathAsync(op.OriginalFolderPath);
+                        folderCache[op.OriginalFolderPath] = originalFolder;
                     }
-                    originalFolder = await StorageFolder.GetFolderFromPathAsync(op.OriginalFolderPath);
 
                     // Move back to original location
                     await file.MoveAsync(originalFolder, op.OriginalFileName, NameCollisionOption.GenerateUniqueName);
@@ -2643,8 +2615,9 @@ public sealed partial class MainPage : Page
                     // First, recursively clean up any empty subfolders within this folder
                     await CleanupEmptyFoldersAsync(folder);
 
-                    // Now check if this folder is empty (no files and no subfolders remaining)
-                    var items = await folder.GetItemsAsync();
+                    // Now check if this folder is empty (no files and no subfolders remaining).
+                    // Only ask for the first item - one is enough to know the folder must stay.
+                    var items = await folder.GetItemsAsync(0, 1);
                     if (items.Count == 0)
                     {
                         await folder.DeleteAsync();
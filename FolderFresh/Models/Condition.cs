@@ -7,6 +7,12 @@ namespace FolderFresh.Models;
 /// </summary>
 public class Condition
 {
+    private string _value = string.Empty;
+    private string? _secondaryValue;
+
+    // Value parsed by the rule engine (size in bytes, date threshold), reset when either value changes
+    private object? _parsedValue;
+
     /// <summary>
     /// The file attribute to evaluate
     /// </summary>
@@ -23,13 +29,43 @@ public class Condition
     /// The value to compare against
     /// </summary>
     [JsonPropertyName("value")]
-    public string Value { get; set; } = string.Empty;
+    public string Value
+    {
+        get => _value;
+        set
+        {
+            _value = value;
+            _parsedValue = null;
+        }
+    }
 
     /// <summary>
     /// Secondary value for operators like "between" or "is in the last X days"
     /// </summary>
     [JsonPropertyName("secondaryValue")]
-    public string? SecondaryValue { get; set; }
+    public string? SecondaryValue
+    {
+        get => _secondaryValue;
+        set
+        {
+            _secondaryValue = value;
+            _parsedValue = null;
+        }
+    }
+
+    /// <summary>
+    /// Returns Value and SecondaryValue parsed by the given function, parsing them only once
+    /// until either value changes
+    /// </summary>
+    public T GetParsedValue<T>(Func<string, string?, T> parse)
+    {
+        if (_parsedValue is ParsedValue<T> cached)
+            return cached.Value;
+
+        var parsed = parse(_value, _secondaryValue);
+        _parsedValue = new ParsedValue<T>(parsed);
+        return parsed;
+    }
 
     /// <summary>
     /// Display string describing this condition
@@ -82,6 +118,8 @@ public class Condition
 
         return $"\"{Value}\"";
     }
+
+    private sealed record ParsedValue<T>(T Value);
 }
 
 /// <summary>
@@ -1,5 +1,4 @@
 using System.Collections.Generic;
-using System.Linq;
 
 namespace FolderFresh.Models;
 
@@ -19,7 +18,7 @@ public class FileOrganizeResult
     /// </summary>
     public string? DestinationPath
     {
-        get => AllDestinations.FirstOrDefault().Path;
+        get => AllDestinations.Count > 0 ? AllDestinations[0].Path : null;
         set
         {
             // For backward compatibility - set as the only destination
@@ -99,5 +98,5 @@ public class FileOrganizeResult
     /// Whether this file was explicitly ignored by a rule's Ignore action
     /// </summary>
     public bool IsIgnoredByRule => MatchedBy == OrganizeMatchType.Rule &&
-                                   Actions.Any(a => a.Type == ActionType.Ignore);
+                                   Actions.Exists(a => a.Type == ActionType.Ignore);
 }
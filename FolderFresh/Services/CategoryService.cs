@@ -16,6 +16,7 @@ public class CategoryService
 
     private readonly string _categoriesFilePath;
     private List<Category> _categories = new();
+    private CategoryMatcher? _extensionMatcher;
 
     private static readonly JsonSerializerOptions JsonOptions = new()
     {
@@ -60,6 +61,7 @@ public class CategoryService
             if (data?.Categories != null && data.Categories.Count > 0)
             {
                 _categories = data.Categories;
+                _extensionMatcher = null;
                 if (EnsureDefaultCategoryExtensions(_categories))
                 {
                     await SaveCategoriesAsync(_categories);
@@ -78,6 +80,7 @@ public class CategoryService
         {
             // On any error, return defaults
             _categories = GetDefaultCategories();
+            _extensionMatcher = null;
             return _categories;
         }
     }
@@ -90,6 +93,7 @@ public class CategoryService
         try
         {
             _categories = categories;
+            _extensionMatcher = null; // Rebuilt on next lookup
             var data = new CategoriesFile { Categories = categories };
             var json = JsonSerializer.Serialize(data, JsonOptions);
             await File.WriteAllTextAsync(_categoriesFilePath, json);
@@ -100,6 +104,24 @@ public class CategoryService
         }
     }
 
+    /// <summary>
+    /// Replaces all categories (e.g. when switching profiles) and saves to file.
+    /// Applies the same fix-ups as LoadCategoriesAsync, so callers don't need to read the file back afterwards.
+    /// </summary>
+    public async Task ReplaceCategoriesAsync(List<Category> categories)
+    {
+        if (categories.Count == 0)
+        {
+            categories = GetDefaultCategories();
+        }
+        else
+        {
+            EnsureDefaultCategoryExtensions(categories);
+        }
+
+        await SaveCategoriesAsync(categories);
+    }
+
     /// <summary>
     /// Adds a new category and saves to file.
     /// </summary>
@@ -162,35 +184,12 @@ public class CategoryService
             return GetFallbackCategory();
         }
 
-        // Normalize extension
-        extension = extension.ToLowerInvariant();
-        if (!extension.StartsWith('.'))
-        {
-            extension = "." + extension;
-        }
-
-        // Check custom categories first (non-default, in order added)
-        var customCategory = _categories
-            .Where(c => !c.IsDefault && c.IsEnabled)
-            .FirstOrDefault(c => c.Extensions.Contains(extension, StringComparer.OrdinalIgnoreCase));
+        // Single dictionary probe instead of scanning every category's extension list.
+        // The lookup is rebuilt whenever the categories are loaded or saved.
+        _extensionMatcher ??= new CategoryMatcher(_categories);
 
-        if (customCategory != null)
-        {
-            return customCategory;
-        }
-
-        // Check default categories (excluding fallback)
-        var defaultCategory = _categories
-            .Where(c => c.IsDefault && !c.IsFallback && c.IsEnabled)
-            .FirstOrDefault(c => c.Extensions.Contains(extension, StringComparer.OrdinalIgnoreCase));
-
-        if (defaultCategory != null)
-        {
-            return defaultCategory;
-        }
-
-        // Return fallback category
-        return GetFallbackCategory();
+        // Return fallback category if no extension matched
+        return _extensionMatcher.FindByExtension(extension) ?? GetFallbackCategory();
     }
 
     /// <summary>
@@ -356,6 +355,70 @@ public class CategoryService
     }
 }
 
+/// <summary>
+/// Precomputed extension lookup for matching many files against one list of categories.
+/// Resolves the same way as CategoryService.GetCategoryForFile: enabled custom categories first
+/// (in order added), then enabled default categories, then the fallback category.
+/// </summary>
+public class CategoryMatcher
+{
+    private readonly Dictionary<string, Category> _categoriesByExtension = new(StringComparer.OrdinalIgnoreCase);
+
+    public CategoryMatcher(IEnumerable<Category> categories)
+    {
+        var categoryList = categories.ToList();
+
+        // Check custom categories first (non-default), then defaults (excluding fallback).
+        // The first category to claim an extension wins, matching the original scan order.
+        foreach (var category in categoryList.Where(c => !c.IsDefault && c.IsEnabled))
+        {
+            AddExtensions(category);
+        }
+
+        foreach (var category in categoryList.Where(c => c.IsDefault && !c.IsFallback && c.IsEnabled))
+        {
+            AddExtensions(category);
+        }
+
+        Fallback = categoryList.FirstOrDefault(c => c.IsFallback);
+    }
+
+    /// <summary>
+    /// The fallback category from the list, if it has one.
+    /// </summary>
+    public Category? Fallback { get; }
+
+    /// <summary>
+    /// Finds the category that lists the extension, or null when no category does.
+    /// </summary>
+    public Category? FindByExtension(string extension)
+    {
+        if (string.IsNullOrEmpty(extension))
+        {
+            return null;
+        }
+
+        // Normalize extension (lookup is case-insensitive)
+        if (!extension.StartsWith('.'))
+        {
+            extension = "." + extension;
+        }
+
+        return _categoriesByExtension.TryGetValue(extension, out var category) ? category : null;
+    }
+
+    private void AddExtensions(Category category)
+    {
+        foreach (var extension in category.Extensions)
+        {
+            if (!string.IsNullOrEmpty(extension))
+            {
+                _categoriesByExtension.TryAdd(extension, category);
+            }
+        }
+    }
+}
+
 /// <summary>
 /// Wrapper class for JSON serialization.
 /// </summary>
@@ -29,6 +29,7 @@ public class FolderWatcherManager : IDisposable
     private readonly ConcurrentDictionary<string, List<FileChangeInfo>> _pendingChanges = new();
     private readonly ConcurrentDictionary<string, DateTime> _recentlyOrganizedFiles = new();
     private readonly ConcurrentDictionary<string, PendingRenameInfo> _pendingRenames = new();
+    private readonly WatchedFolderScanCache _scanCache = new();
     private readonly object _lockObject = new();
 
     private const int DebounceDelayMs = 1000;
@@ -44,6 +45,20 @@ public class FolderWatcherManager : IDisposable
         PropertyNamingPolicy = JsonNamingPolicy.CamelCase
     };
 
+    // Extensions used by browsers and download managers for in-progress downloads
+    private static readonly HashSet<string> IncompleteDownloadExtensions = new(StringComparer.OrdinalIgnoreCase)
+    {
+        ".part",        // Firefox, others
+        ".crdownload",  // Chrome
+        ".partial",     // IE/Edge
+        ".download",    // Safari
+        ".tmp",         // Various
+        ".temp",        // Various
+        ".!ut",         // uTorrent
+        ".bc!",         // BitComet
+        ".aria2"        // aria2
+    };
+
     /// <summary>
     /// Raised when files in a watched folder change.
     /// </summary>
@@ -161,8 +176,9 @@ public class FolderWatcherManager : IDisposable
             watcher.Dispose();
         }
 
-        // Clear pending changes
+        // Clear pending changes and the unchanged-file cache
         _pendingChanges.TryRemove(watchedFolderId, out _);
+        _scanCache.Remove(watchedFolderId);
 
         // Update status
         var folder = _watchedFolderService.GetWatchedFolder(watchedFolderId);
@@ -514,21 +530,7 @@ public class FolderWatcherManager : IDisposable
     /// </summary>
     private static bool IsIncompleteDownload(string filePath)
     {
-        var extension = Path.GetExtension(filePath).ToLowerInvariant();
-        var incompleteExtensions = new[]
-        {
-            ".part",        // Firefox, others
-            ".crdownload",  // Chrome
-            ".partial",     // IE/Edge
-            ".download",    // Safari
-            ".tmp",         // Various
-            ".temp",        // Various
-            ".!ut",         // uTorrent
-            ".bc!",         // BitComet
-            ".aria2"        // aria2
-        };
-
-        return incompleteExtensions.Contains(extension);
+        return IncompleteDownloadExtensions.Contains(Path.GetExtension(filePath));
     }
 
     /// <summary>
@@ -536,9 +538,8 @@ public class FolderWatcherManager : IDisposable
     /// </summary>
     private static bool IsFileAccessible(string filePath)
     {
-        if (!File.Exists(filePath))
-            return false;
-
+        // A missing file surfaces as FileNotFoundException (an IOException) from File.Open,
+        // so no separate existence check is needed
         try
         {
             using var stream = File.Open(filePath, FileMode.Open, FileAccess.Read, FileShare.ReadWrite);
@@ -840,18 +841,24 @@ public class FolderWatcherManager : IDisposable
         folder.Status = newStatus;
         folder.LastError = errorMessage;
 
-        await _watchedFolderService.UpdateWatchedFolderAsync(folder);
+        // Organizing is transient (it is reset on load), so skip the disk write for it.
+        // The status that ends the run is written once, together with LastOrganizedAt
+        // and FileCount, instead of saving watchedFolders.json at both ends of every run.
+        if (newStatus != WatchStatus.Organizing)
+        {
+            await _watchedFolderService.UpdateWatchedFolderAsync(folder);
+        }
 
         RaiseStatusChanged(folder.Id, oldStatus, newStatus, errorMessage);
     }
 
     private async Task<(List<Rule> rules, List<Category> categories, AppSettings settings)> LoadProfileDataAsync(Profile profile)
     {
-        // Clear caches and reload from disk to get the latest data
-        // This is necessary because UI components have their own service instances
-        // that save directly to JSON files, so our in-memory caches may be stale
+        // Clear caches and reload categories from disk. UI components have their own service
+        // instances that save directly to JSON files, so our in-memory caches may be stale.
+        // Categories are reloaded for every profile: MoveToCategory, {Category} expansion and
+        // destination calculation read the shared category service whichever profile is in use.
         _settingsService.ClearCache();
-        await _ruleService.LoadRulesAsync();
         await _categoryService.LoadCategoriesAsync();
 
         var currentProfileId = _settingsService.GetSettings().CurrentProfileId;
@@ -865,6 +872,10 @@ public class FolderWatcherManager : IDisposable
 
         if (isCurrentProfile)
         {
+            // Rules are only read from the service for the active profile; other profiles
+            // use the rules stored in their snapshot below
+            await _ruleService.LoadRulesAsync();
+
             // This is the active profile - use live data from services
             rules = _ruleService.GetRules();
             categories = _categoryService.GetCategories();
@@ -943,12 +954,29 @@ public class FolderWatcherManager : IDisposable
         // Use profile's IncludeSubfolders setting
         var includeSubfolders = settings.IncludeSubfolders;
 
+        // Filter and sort the rules and index category extensions once for the whole scan rather than per file
+        var orderedRules = RuleService.GetEnabledRulesByPriority(rules);
+        var categoryMatcher = new CategoryMatcher(categories);
+
+        // Files left in place by the last run don't need their rules re-evaluated while neither
+        // the file nor the profile configuration has changed since. Preview always evaluates
+        // everything because it has to report a result for each file.
+        var scanCache = previewOnly
+            ? null
+            : _scanCache.BeginScan(folder.Id, WatchedFolderScanCache.GetConfigurationSignature(
+                orderedRules, categories, settings, _categoryService.GetCategories()));
+
         await Task.Run(() =>
         {
             // Scan root folder
-            ScanDirectory(basePath, basePath, rules, categories, settings, includeSubfolders, previewOnly, result);
+            ScanDirectory(basePath, basePath, orderedRules, categoryMatcher, settings, includeSubfolders, previewOnly, result, scanCache);
         });
 
+        if (scanCache != null)
+        {
+            _scanCache.CompleteScan(folder.Id, scanCache);
+        }
+
         return result;
     }
 
@@ -956,46 +984,51 @@ public class FolderWatcherManager : IDisposable
         string currentPath,
         string basePath,
         List<Rule> rules,
-        List<Category> categories,
+        CategoryMatcher categoryMatcher,
         AppSettings settings,
         bool includeSubfolders,
         bool previewOnly,
-        OrganizationResult result)
+        OrganizationResult result,
+        WatchedFolderScanCache.Scan? scanCache)
     {
         try
         {
-            var files = Directory.GetFiles(currentPath);
-
-            foreach (var filePath in files)
+            // Snapshot the directory up front: the FileInfo entries come back with attributes,
+            // size and timestamps already populated from the directory listing, so no extra
+            // stat is needed per file. A snapshot (rather than lazy enumeration) also keeps
+            // files renamed in place from being picked up a second time.
+            var directoryInfo = new DirectoryInfo(currentPath);
+            var files = directoryInfo.GetFiles();
+
+            foreach (var fileInfo in files)
             {
                 result.TotalFilesScanned++;
 
                 try
                 {
-                    // Skip if file no longer exists (may have been renamed/deleted)
-                    if (!File.Exists(filePath))
+                    // Skip hidden/system files based on settings (uses cached attributes)
+                    if (ShouldSkipFile(fileInfo, settings))
                     {
                         result.FilesSkipped++;
                         continue;
                     }
 
-                    // Skip if file is locked/in-use
-                    if (!IsFileAccessible(filePath))
+                    // Skip files the last run already left in place if they haven't changed since
+                    // (uses the listing's cached timestamps - no need to open the file)
+                    if (scanCache != null && scanCache.TryReuse(fileInfo))
                     {
                         result.FilesSkipped++;
                         continue;
                     }
 
-                    var fileInfo = new FileInfo(filePath);
-
-                    // Skip hidden/system files based on settings
-                    if (ShouldSkipFile(fileInfo, settings))
+                    // Skip if file is locked/in-use or no longer exists (may have been renamed/deleted)
+                    if (!IsFileAccessible(fileInfo.FullName))
                     {
                         result.FilesSkipped++;
                         continue;
                     }
 
-                    var organizeResult = GetFileOrganizeResult(fileInfo, basePath, rules, categories, settings);
+                    var organizeResult = GetFileOrganizeResult(fileInfo, basePath, rules, categoryMatcher, settings);
 
                     if (organizeResult != null && organizeResult.WillBeOrganized)
                     {
@@ -1029,6 +1062,8 @@ public class FolderWatcherManager : IDisposable
                         {
                             result.PreviewResults.Add(organizeResult);
                         }
+
+                        scanCache?.RecordUnchanged(fileInfo);
                     }
                 }
                 catch (Exception ex)
@@ -1040,20 +1075,18 @@ public class FolderWatcherManager : IDisposable
             // Process subfolders if enabled
             if (includeSubfolders)
             {
-                var subdirs = Directory.GetDirectories(currentPath);
-                foreach (var subdir in subdirs)
+                var subdirs = directoryInfo.GetDirectories();
+                foreach (var dirInfo in subdirs)
                 {
                     try
                     {
-                        var dirInfo = new DirectoryInfo(subdir);
-
                         // Skip hidden/system folders
                         if (settings.IgnoreHiddenFiles && (dirInfo.Attributes & System.IO.FileAttributes.Hidden) != 0)
                             continue;
                         if (settings.IgnoreSystemFiles && (dirInfo.Attributes & System.IO.FileAttributes.System) != 0)
                             continue;
 
-                        ScanDirectory(subdir, basePath, rules, categories, settings, includeSubfolders, previewOnly, result);
+                        ScanDirectory(dirInfo.FullName, basePath, rules, categoryMatcher, settings, includeSubfolders, previewOnly, result, scanCache);
                     }
                     catch
                     {
@@ -1088,7 +1121,7 @@ public class FolderWatcherManager : IDisposable
         FileInfo fileInfo,
         string basePath,
         List<Rule> rules,
-        List<Category> categories,
+        CategoryMatcher categoryMatcher,
         AppSettings settings)
     {
         var result = new FileOrganizeResult
@@ -1098,9 +1131,10 @@ public class FolderWatcherManager : IDisposable
         };
 
         // Step 1: Try rules first (if enabled)
-        if (settings.UseRulesFirst && rules.Any(r => r.IsEnabled))
+        // Rules are already filtered to enabled rules in priority order
+        if (settings.UseRulesFirst && rules.Count > 0)
         {
-            var matchingRules = _ruleService.GetMatchingRulesWithContinue(fileInfo, rules);
+            var matchingRules = _ruleService.GetMatchingRulesFromOrdered(fileInfo, rules);
             if (matchingRules.Count > 0)
             {
                 var allActions = matchingRules.SelectMany(r => r.Actions).ToList();
@@ -1143,7 +1177,7 @@ public class FolderWatcherManager : IDisposable
         // Step 2: Fall back to categories (if enabled)
         if (settings.FallbackToCategories)
         {
-            var category = GetCategoryForFile(fileInfo.Extension, categories);
+            var category = categoryMatcher.FindByExtension(fileInfo.Extension) ?? categoryMatcher.Fallback;
             if (category != null && category.IsEnabled)
             {
                 var expectedFolder = Path.Combine(basePath, category.Destination);
@@ -1170,35 +1204,6 @@ public class FolderWatcherManager : IDisposable
         return null;
     }
 
-    private static Category? GetCategoryForFile(string extension, List<Category> categories)
-    {
-        if (string.IsNullOrEmpty(extension))
-            return categories.FirstOrDefault(c => c.IsFallback);
-
-        extension = extension.ToLowerInvariant();
-        if (!extension.StartsWith('.'))
-            extension = "." + extension;
-
-        // Check non-default categories first
-        var customCategory = categories
-            .Where(c => !c.IsDefault && c.IsEnabled)
-            .FirstOrDefault(c => c.Extensions.Contains(extension, StringComparer.OrdinalIgnoreCase));
-
-        if (customCategory != null)
-            return customCategory;
-
-        // Check default categories (excluding fallback)
-        var defaultCategory = categories
-            .Where(c => c.IsDefault && !c.IsFallback && c.IsEnabled)
-            .FirstOrDefault(c => c.Extensions.Contains(extension, StringComparer.OrdinalIgnoreCase));
-
-        if (defaultCategory != null)
-            return defaultCategory;
-
-        // Return fallback
-        return categories.FirstOrDefault(c => c.IsFallback);
-    }
-
     private void ExecuteOrganization(FileOrganizeResult organizeResult, FileInfo fileInfo, string basePath)
     {
         if (organizeResult.MatchedBy == OrganizeMatchType.Rule)
@@ -1223,18 +1228,27 @@ public class FolderWatcherManager : IDisposable
         var currentFilePath = fileInfo.FullName;
         var currentFileName = fileInfo.Name;
         var currentDirectory = fileInfo.DirectoryName!;
+        var actions = result.Actions;
 
-        foreach (var action in result.Actions)
+        // New name from a Rename that the following move action applies
+        string? pendingName = null;
+
+        for (var i = 0; i < actions.Count; i++)
         {
+            var action = actions[i];
             switch (action.Type)
             {
                 case ActionType.MoveToFolder:
+                case ActionType.MoveToCategory:
+                case ActionType.SortIntoSubfolder:
                     {
-                        var destFolder = action.Value;
-                        if (!Path.IsPathRooted(destFolder))
-                            destFolder = Path.Combine(basePath, destFolder);
+                        var destFolder = RuleService.ResolveMoveDestinationFolder(action, fileInfo, basePath, _categoryService);
+                        if (destFolder == null)
+                            break;
 
-                        var targetPath = Path.Combine(destFolder, currentFileName);
+                        // A directly preceding Rename is applied here, in the same File.Move
+                        var targetPath = Path.Combine(destFolder, pendingName ?? currentFileName);
+                        pendingName = null;
                         if (currentFilePath.Equals(targetPath, StringComparison.OrdinalIgnoreCase))
                             break;
 
@@ -1266,58 +1280,17 @@ public class FolderWatcherManager : IDisposable
                     }
                     break;
 
-                case ActionType.MoveToCategory:
+                case ActionType.Rename:
                     {
-                        var categoryId = action.Value;
-                        var categories = _categoryService.GetCategories();
-                        var category = categories.FirstOrDefault(c => c.Id == categoryId);
+                        var newName = RuleService.ExpandPattern(action.Value, fileInfo, _categoryService);
 
-                        if (category != null)
+                        // Rename followed by a move to another folder: the move applies the new name
+                        if (RuleService.IsRenameFollowedByMove(actions, i, fileInfo, basePath, currentDirectory, _categoryService))
                         {
-                            var destFolder = Path.IsPathRooted(category.Destination)
-                                ? category.Destination
-                                : Path.Combine(basePath, category.Destination);
-
-                            var targetPath = Path.Combine(destFolder, currentFileName);
-                            if (currentFilePath.Equals(targetPath, StringComparison.OrdinalIgnoreCase))
-                                break;
-
-                            Directory.CreateDirectory(destFolder);
-                            var destPath = GetUniqueFilePath(targetPath, currentFilePath);
-                            File.Move(currentFilePath, destPath);
-                            MarkAsRecentlyOrganized(destPath);
-
-                            currentFilePath = destPath;
-                            currentFileName = Path.GetFileName(destPath);
-                            currentDirectory = destFolder;
-                        }
-                    }
-                    break;
-
-                case ActionType.SortIntoSubfolder:
-                    {
-                        var subfolderName = RuleService.ExpandPattern(action.Value, fileInfo, _categoryService);
-                        subfolderName = subfolderName.Replace('/', Path.DirectorySeparatorChar);
-                        var destFolder = Path.Combine(basePath, subfolderName);
-
-                        var targetPath = Path.Combine(destFolder, currentFileName);
-                        if (currentFilePath.Equals(targetPath, StringComparison.OrdinalIgnoreCase))
+                            pendingName = newName;
                             break;
+                        }
 
-                        Directory.CreateDirectory(destFolder);
-                        var destPath = GetUniqueFilePath(targetPath, currentFilePath);
-                        File.Move(currentFilePath, destPath);
-                        MarkAsRecentlyOrganized(destPath);
-
-                        currentFilePath = destPath;
-                        currentFileName = Path.GetFileName(destPath);
-                        currentDirectory = destFolder;
-                    }
-                    break;
-
-                case ActionType.Rename:
-                    {
-                        var newName = RuleService.ExpandPattern(action.Value, fileInfo, _categoryService);
                         var targetPath = Path.Combine(currentDirectory, newName);
 
                         if (currentFilePath.Equals(targetPath, StringComparison.Ordinal))
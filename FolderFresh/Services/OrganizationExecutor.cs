@@ -180,18 +180,34 @@ public class OrganizationExecutor
         var currentFilePath = result.SourcePath;
         var currentFileName = Path.GetFileName(currentFilePath);
         var currentDirectory = Path.GetDirectoryName(currentFilePath)!;
+        var actions = result.Actions;
 
-        foreach (var action in result.Actions)
+        // Patterns expand against the original file. FileInfo reads its metadata lazily, so load it
+        // now while the file is still at its source path; otherwise a pattern expanded after the
+        // first move would read the metadata of a path that no longer exists
+        var sourceInfo = new FileInfo(result.SourcePath);
+        if (actions.Any(a => a.Type is ActionType.Rename or ActionType.SortIntoSubfolder))
+            sourceInfo.Refresh();
+
+        // New name from a Rename that the following move action applies
+        string? pendingName = null;
+
+        for (var i = 0; i < actions.Count; i++)
         {
+            var action = actions[i];
             switch (action.Type)
             {
                 case ActionType.MoveToFolder:
+                case ActionType.MoveToCategory:
+                case ActionType.SortIntoSubfolder:
                     {
-                        var destFolder = action.Value;
-                        if (!Path.IsPathRooted(destFolder))
-                            destFolder = Path.Combine(basePath, destFolder);
+                        var destFolder = RuleService.ResolveMoveDestinationFolder(action, sourceInfo, basePath, _categoryService);
+                        if (destFolder == null)
+                            break;
 
-                        var targetPath = Path.Combine(destFolder, currentFileName);
+                        // A directly preceding Rename is applied here, in the same File.Move
+                        var targetPath = Path.Combine(destFolder, pendingName ?? currentFileName);
+                        pendingName = null;
                         if (currentFilePath.Equals(targetPath, StringComparison.OrdinalIgnoreCase))
                             break;
 
@@ -235,72 +251,17 @@ public class OrganizationExecutor
                     }
                     break;
 
-                case ActionType.MoveToCategory:
+                case ActionType.Rename:
                     {
-                        var categoryId = action.Value;
-                        var categories = _categoryService.GetCategories();
-                        var category = categories.FirstOrDefault(c => c.Id == categoryId);
+                        var newName = RuleService.ExpandPattern(action.Value, sourceInfo, _categoryService);
 
-                        if (category != null)
+                        // Rename followed by a move to another folder: the move applies the new name
+                        if (RuleService.IsRenameFollowedByMove(actions, i, sourceInfo, basePath, currentDirectory, _categoryService))
                         {
-                            var destFolder = Path.IsPathRooted(category.Destination)
-                                ? category.Destination
-                                : Path.Combine(basePath, category.Destination);
-
-                            var targetPath = Path.Combine(destFolder, currentFileName);
-                            if (currentFilePath.Equals(targetPath, StringComparison.OrdinalIgnoreCase))
-                                break;
-
-                            Directory.CreateDirectory(destFolder);
-                            var destPath = GetUniqueFilePath(targetPath, currentFilePath);
-                            await Task.Run(() => File.Move(currentFilePath, destPath));
-
-                            operations.Add(new MoveOperation
-                            {
-                                OriginalPath = currentFilePath,
-                                NewPath = destPath,
-                                ActionType = "move"
-                            });
-
-                            currentFilePath = destPath;
-                            currentFileName = Path.GetFileName(destPath);
-                            currentDirectory = destFolder;
-                        }
-                    }
-                    break;
-
-                case ActionType.SortIntoSubfolder:
-                    {
-                        var fileInfo = new FileInfo(result.SourcePath);
-                        var subfolderName = RuleService.ExpandPattern(action.Value, fileInfo, _categoryService);
-                        subfolderName = subfolderName.Replace('/', Path.DirectorySeparatorChar);
-                        var destFolder = Path.Combine(basePath, subfolderName);
-
-                        var targetPath = Path.Combine(destFolder, currentFileName);
-                        if (currentFilePath.Equals(targetPath, StringComparison.OrdinalIgnoreCase))
+                            pendingName = newName;
                             break;
+                        }
 
-                        Directory.CreateDirectory(destFolder);
-                        var destPath = GetUniqueFilePath(targetPath, currentFilePath);
-                        await Task.Run(() => File.Move(currentFilePath, destPath));
-
-                        operations.Add(new MoveOperation
-                        {
-                            OriginalPath = currentFilePath,
-                            NewPath = destPath,
-                            ActionType = "move"
-                        });
-
-                        currentFilePath = destPath;
-                        currentFileName = Path.GetFileName(destPath);
-                        currentDirectory = destFolder;
-                    }
-                    break;
-
-                case ActionType.Rename:
-                    {
-                        var fileInfo = new FileInfo(result.SourcePath);
-                        var newName = RuleService.ExpandPattern(action.Value, fileInfo, _categoryService);
                         var targetPath = Path.Combine(currentDirectory, newName);
 
                         if (currentFilePath.Equals(targetPath, StringComparison.Ordinal))
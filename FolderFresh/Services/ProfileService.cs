@@ -321,13 +321,12 @@ public class ProfileService
         var rules = DeserializeRules(profile.RulesJson);
         System.Diagnostics.Debug.WriteLine($"[ProfileService] LoadProfileIntoServicesAsync: loading profile '{profile.Name}' with {rules.Count} rules");
 
-        await _ruleService.SaveRulesAsync(rules);
-        await _ruleService.LoadRulesAsync();
+        // Replace* keeps the saved list as the in-memory state, so there's no need to read it straight back
+        await _ruleService.ReplaceRulesAsync(rules);
 
         // Deserialize and load categories
         var categories = DeserializeCategories(profile.CategoriesJson);
-        await _categoryService.SaveCategoriesAsync(categories);
-        await _categoryService.LoadCategoriesAsync();
+        await _categoryService.ReplaceCategoriesAsync(categories);
 
         // Deserialize and load settings from the profile
         // This ensures each profile has its own organization mode, toggles, etc.
@@ -83,6 +83,11 @@ public class RuleService
         { ".woff2", FileKind.Font }
     };
 
+    // Custom-format date tokens used by ExpandPattern, compiled once instead of per call
+    private static readonly Regex DateFormatPattern = new(@"\{date:([^}]+)\}", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+    private static readonly Regex CreatedFormatPattern = new(@"\{created:([^}]+)\}", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+    private static readonly Regex TodayFormatPattern = new(@"\{today:([^}]+)\}", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
     public RuleService() : this(null, null)
     {
     }
@@ -152,6 +157,16 @@ public class RuleService
         }
     }
 
+    /// <summary>
+    /// Replaces all rules (e.g. when switching profiles) and saves to file.
+    /// Leaves the in-memory list in the same priority order LoadRulesAsync produces,
+    /// so callers don't need to read the file back afterwards.
+    /// </summary>
+    public async Task ReplaceRulesAsync(List<Rule> rules)
+    {
+        await SaveRulesAsync(rules.OrderBy(r => r.Priority).ToList());
+    }
+
     /// <summary>
     /// Gets all loaded rules.
     /// </summary>
@@ -259,11 +274,29 @@ public class RuleService
     /// </summary>
     public List<Rule> GetMatchingRulesWithContinue(FileInfo file, List<Rule> rules)
     {
-        var matchingRules = new List<Rule>();
-        var orderedRules = rules
+        return GetMatchingRulesFromOrdered(file, GetEnabledRulesByPriority(rules));
+    }
+
+    /// <summary>
+    /// Returns the enabled rules in priority order.
+    /// Scans should compute this once and pass it to GetMatchingRulesFromOrdered
+    /// instead of filtering and re-sorting the rule list for every file.
+    /// </summary>
+    public static List<Rule> GetEnabledRulesByPriority(IEnumerable<Rule> rules)
+    {
+        return rules
             .Where(r => r.IsEnabled)
             .OrderBy(r => r.Priority)
             .ToList();
+    }
+
+    /// <summary>
+    /// Gets all matching rules for a file, respecting the Continue action.
+    /// Expects rules already prepared by GetEnabledRulesByPriority (enabled only, in priority order).
+    /// </summary>
+    public List<Rule> GetMatchingRulesFromOrdered(FileInfo file, List<Rule> orderedRules)
+    {
+        var matchingRules = new List<Rule>();
 
         foreach (var rule in orderedRules)
         {
@@ -322,13 +355,14 @@ public class RuleService
                     break;
 
                 case ActionType.MoveToFolder:
-                    var moveDestFolder = action.Value;
-                    if (!Path.IsPathRooted(moveDestFolder))
+                case ActionType.MoveToCategory:
+                case ActionType.SortIntoSubfolder:
+                    var moveDestFolder = ResolveMoveDestinationFolder(action, file, baseFolderPath, categoryService);
+                    if (moveDestFolder != null)
                     {
-                        moveDestFolder = Path.Combine(baseFolderPath, moveDestFolder);
+                        currentDirectory = moveDestFolder;
+                        primaryDestination = Path.Combine(moveDestFolder, currentFileName);
                     }
-                    currentDirectory = moveDestFolder;
-                    primaryDestination = Path.Combine(moveDestFolder, currentFileName);
                     break;
 
                 case ActionType.CopyToFolder:
@@ -343,31 +377,6 @@ public class RuleService
                     allDestinations.Add(copyDestPath);
                     break;
 
-                case ActionType.MoveToCategory:
-                    if (categoryService != null && !string.IsNullOrEmpty(action.Value))
-                    {
-                        var categories = categoryService.GetCategories();
-                        var category = categories.FirstOrDefault(c => c.Id == action.Value);
-                        if (category != null)
-                        {
-                            var categoryPath = Path.IsPathRooted(category.Destination)
-                                ? category.Destination
-                                : Path.Combine(baseFolderPath, category.Destination);
-                            currentDirectory = categoryPath;
-                            primaryDestination = Path.Combine(categoryPath, currentFileName);
-                        }
-                    }
-                    break;
-
-                case ActionType.SortIntoSubfolder:
-                    var subfolderName = ExpandPattern(action.Value, file, categoryService);
-                    // Normalize path separators (user might use / in pattern)
-                    subfolderName = subfolderName.Replace('/', Path.DirectorySeparatorChar);
-                    var subfolderPath = Path.Combine(baseFolderPath, subfolderName);
-                    currentDirectory = subfolderPath;
-                    primaryDestination = Path.Combine(subfolderPath, currentFileName);
-                    break;
-
                 case ActionType.Delete:
                     // Delete is a terminal action
                     return new List<string> { "[RECYCLE BIN]" };
@@ -392,6 +401,49 @@ public class RuleService
         return result;
     }
 
+    /// <summary>
+    /// Resolves the destination folder for a move-type action (MoveToFolder, MoveToCategory, SortIntoSubfolder).
+    /// Returns null for other action types or when the destination cannot be resolved.
+    /// </summary>
+    public static string? ResolveMoveDestinationFolder(RuleAction action, FileInfo file, string baseFolderPath, CategoryService? categoryService)
+    {
+        switch (action.Type)
+        {
+            case ActionType.MoveToFolder:
+                return Path.IsPathRooted(action.Value) ? action.Value : Path.Combine(baseFolderPath, action.Value);
+
+            case ActionType.MoveToCategory:
+                var category = categoryService?.GetCategories().FirstOrDefault(c => c.Id == action.Value);
+                if (category == null)
+                    return null;
+                return Path.IsPathRooted(category.Destination)
+                    ? category.Destination
+                    : Path.Combine(baseFolderPath, category.Destination);
+
+            case ActionType.SortIntoSubfolder:
+                // Normalize path separators (user might use / in pattern)
+                var subfolderName = ExpandPattern(action.Value, file, categoryService).Replace('/', Path.DirectorySeparatorChar);
+                return Path.Combine(baseFolderPath, subfolderName);
+
+            default:
+                return null;
+        }
+    }
+
+    /// <summary>
+    /// Returns true when the Rename at renameIndex is directly followed by a move to a folder other
+    /// than currentDirectory. Executors then apply the new name as part of that move, in a single
+    /// File.Move, instead of renaming in place first.
+    /// </summary>
+    public static bool IsRenameFollowedByMove(IReadOnlyList<RuleAction> actions, int renameIndex, FileInfo file, string baseFolderPath, string currentDirectory, CategoryService? categoryService)
+    {
+        if (renameIndex + 1 >= actions.Count)
+            return false;
+
+        var nextFolder = ResolveMoveDestinationFolder(actions[renameIndex + 1], file, baseFolderPath, categoryService);
+        return nextFolder != null && !nextFolder.Equals(currentDirectory, StringComparison.OrdinalIgnoreCase);
+    }
+
     /// <summary>
     /// Gets the primary action type for a rule (first move/copy/delete action).
     /// </summary>
@@ -425,14 +477,15 @@ public class RuleService
                     break;
 
                 case ActionType.MoveToFolder:
-                    var moveDestFolder = action.Value;
-                    if (!Path.IsPathRooted(moveDestFolder))
+                case ActionType.MoveToCategory:
+                case ActionType.SortIntoSubfolder:
+                    var moveDestFolder = ResolveMoveDestinationFolder(action, file, baseFolderPath, categoryService);
+                    if (moveDestFolder != null)
                     {
-                        moveDestFolder = Path.Combine(baseFolderPath, moveDestFolder);
+                        currentDirectory = moveDestFolder;
+                        currentFilePath = Path.Combine(moveDestFolder, currentFileName);
+                        // Don't add yet - we add the final location of the original at the end
                     }
-                    currentDirectory = moveDestFolder;
-                    currentFilePath = Path.Combine(moveDestFolder, currentFileName);
-                    // Don't add yet - we add the final location of the original at the end
                     break;
 
                 case ActionType.CopyToFolder:
@@ -445,29 +498,6 @@ public class RuleService
                     destinations.Add((Path.Combine(copyDestFolder, currentFileName), ActionType.CopyToFolder));
                     break;
 
-                case ActionType.MoveToCategory:
-                    if (categoryService != null && !string.IsNullOrEmpty(action.Value))
-                    {
-                        var categories = categoryService.GetCategories();
-                        var category = categories.FirstOrDefault(c => c.Id == action.Value);
-                        if (category != null)
-                        {
-                            var categoryPath = Path.IsPathRooted(category.Destination)
-                                ? category.Destination
-                                : Path.Combine(baseFolderPath, category.Destination);
-                            currentDirectory = categoryPath;
-                            currentFilePath = Path.Combine(categoryPath, currentFileName);
-                        }
-                    }
-                    break;
-
-                case ActionType.SortIntoSubfolder:
-                    var subfolderName2 = ExpandPattern(action.Value, file, categoryService);
-                    var subfolderPath2 = Path.Combine(baseFolderPath, subfolderName2);
-                    currentDirectory = subfolderPath2;
-                    currentFilePath = Path.Combine(subfolderPath2, currentFileName);
-                    break;
-
                 case ActionType.Delete:
                     // File is deleted - add recycle bin as destination
                     destinations.Add(("[RECYCLE BIN]", ActionType.Delete));
@@ -527,10 +557,10 @@ public class RuleService
                 condition.Operator,
                 condition.Value ?? string.Empty),
 
-            ConditionAttribute.Extension => EvaluateStringCondition(
-                file.Extension.TrimStart('.').ToLowerInvariant(),
+            ConditionAttribute.Extension => EvaluateExtensionCondition(
+                file.Extension,
                 condition.Operator,
-                (condition.Value ?? string.Empty).TrimStart('.').ToLowerInvariant()),
+                condition.Value ?? string.Empty),
 
             ConditionAttribute.FullName => EvaluateStringCondition(
                 file.Name,
@@ -619,6 +649,23 @@ public class RuleService
         };
     }
 
+    /// <summary>
+    /// Evaluates extension conditions, ignoring a leading dot on either side.
+    /// Is/IsNot compare spans directly so the common case allocates nothing;
+    /// string comparisons are already case-insensitive, so no lowercasing is needed.
+    /// </summary>
+    private static bool EvaluateExtensionCondition(string extension, ConditionOperator op, string expected)
+    {
+        if (op is ConditionOperator.Is or ConditionOperator.IsNot)
+        {
+            var matches = extension.AsSpan().TrimStart('.')
+                .Equals(expected.AsSpan().TrimStart('.'), StringComparison.OrdinalIgnoreCase);
+            return op == ConditionOperator.Is ? matches : !matches;
+        }
+
+        return EvaluateStringCondition(extension.TrimStart('.'), op, expected.TrimStart('.'));
+    }
+
     /// <summary>
     /// Evaluates string-based conditions against multiple possible values.
     /// </summary>
@@ -680,7 +727,8 @@ public class RuleService
     /// </summary>
     private static bool EvaluateSizeCondition(long bytes, Condition condition)
     {
-        var targetBytes = ParseSizeToBytes(condition.Value ?? "0", condition.SecondaryValue);
+        // Parsed once per condition rather than for every file it is evaluated against
+        var targetBytes = condition.GetParsedValue((value, unit) => ParseSizeToBytes(value ?? "0", unit));
 
         return condition.Operator switch
         {
@@ -721,13 +769,21 @@ public class RuleService
     {
         return condition.Operator switch
         {
-            ConditionOperator.IsBefore => DateTime.TryParse(condition.Value, out var beforeDate) && actual < beforeDate,
-            ConditionOperator.IsAfter => DateTime.TryParse(condition.Value, out var afterDate) && actual > afterDate,
+            ConditionOperator.IsBefore => ParseDateThreshold(condition) is { } beforeDate && actual < beforeDate,
+            ConditionOperator.IsAfter => ParseDateThreshold(condition) is { } afterDate && actual > afterDate,
             ConditionOperator.IsInTheLast => IsInTheLastInternal(actual, condition.Value ?? "0", condition.SecondaryValue),
             _ => false
         };
     }
 
+    /// <summary>
+    /// Parses an absolute date threshold once per condition value
+    /// </summary>
+    private static DateTime? ParseDateThreshold(Condition condition)
+    {
+        return condition.GetParsedValue<DateTime?>((value, _) => DateTime.TryParse(value, out var date) ? date : null);
+    }
+
     /// <summary>
     /// Checks if a date is within the last N units of time
     /// </summary>
@@ -760,6 +816,21 @@ public class RuleService
             if (string.IsNullOrEmpty(pattern))
                 return string.IsNullOrEmpty(value);
 
+            // Common shapes ("report", "2024-*", "*.pdf") don't need a regex at all
+            if (pattern.IndexOf('?') < 0)
+            {
+                var starCount = pattern.AsSpan().Count('*');
+
+                if (starCount == 0)
+                    return value.Equals(pattern, StringComparison.OrdinalIgnoreCase);
+
+                if (starCount == 1 && pattern[^1] == '*')
+                    return value.AsSpan().StartsWith(pattern.AsSpan(0, pattern.Length - 1), StringComparison.OrdinalIgnoreCase);
+
+                if (starCount == 1 && pattern[0] == '*')
+                    return value.AsSpan().EndsWith(pattern.AsSpan(1), StringComparison.OrdinalIgnoreCase);
+            }
+
             // Convert glob/wildcard to regex
             var regexPattern = "^" + Regex.Escape(pattern)
                 .Replace("\\*", ".*")
@@ -909,10 +980,8 @@ public class RuleService
 
     private async Task<FileInfo> MoveFileAsync(FileInfo file, string destinationFolder, Dictionary<string, string> options)
     {
-        if (!Directory.Exists(destinationFolder))
-        {
-            Directory.CreateDirectory(destinationFolder);
-        }
+        // CreateDirectory is a no-op when the folder already exists
+        Directory.CreateDirectory(destinationFolder);
 
         var destPath = Path.Combine(destinationFolder, file.Name);
 
@@ -932,16 +1001,15 @@ public class RuleService
             }
         }
 
+        // MoveTo repoints the same FileInfo at its new location
         await Task.Run(() => file.MoveTo(destPath));
-        return new FileInfo(destPath);
+        return file;
     }
 
     private async Task CopyFileAsync(FileInfo file, string destinationFolder, Dictionary<string, string> options)
     {
-        if (!Directory.Exists(destinationFolder))
-        {
-            Directory.CreateDirectory(destinationFolder);
-        }
+        // CreateDirectory is a no-op when the folder already exists
+        Directory.CreateDirectory(destinationFolder);
 
         // Refresh file info to ensure we have current state after previous actions
         file.Refresh();
@@ -971,6 +1039,10 @@ public class RuleService
     {
         var newPath = Path.Combine(file.DirectoryName ?? "", newName);
 
+        // Skip if the name is exactly the same (case-sensitive) - nothing to touch on disk
+        if (file.FullName.Equals(newPath, StringComparison.Ordinal))
+            return file;
+
         // Check if this is a case-only rename (same name, different case)
         var isCaseOnlyRename = file.FullName.Equals(newPath, StringComparison.OrdinalIgnoreCase) &&
                                !file.FullName.Equals(newPath, StringComparison.Ordinal);
@@ -982,9 +1054,9 @@ public class RuleService
             await Task.Run(() =>
             {
                 file.MoveTo(tempPath);
-                File.Move(tempPath, newPath);
+                file.MoveTo(newPath);
             });
-            return new FileInfo(newPath);
+            return file;
         }
 
         if (File.Exists(newPath))
@@ -993,7 +1065,7 @@ public class RuleService
         }
 
         await Task.Run(() => file.MoveTo(newPath));
-        return new FileInfo(newPath);
+        return file;
     }
 
     private static string GetUniqueFileName(string path)
@@ -1066,9 +1138,17 @@ public class RuleService
     /// </summary>
     public static string ExpandPattern(string pattern, FileInfo file, CategoryService? categoryService)
     {
+        // Plain folder names and file names contain no tokens
+        if (!pattern.Contains('{'))
+            return pattern;
+
         var result = pattern;
         var now = DateTime.Now;
 
+        // Each LastWriteTime/CreationTime read converts from UTC, so read them once per call
+        var modified = file.LastWriteTime;
+        var created = file.CreationTime;
+
         // {Name} / {name} - filename without extension
         result = result.Replace("{Name}", Path.GetFileNameWithoutExtension(file.Name));
         result = result.Replace("{name}", Path.GetFileNameWithoutExtension(file.Name));
@@ -1079,49 +1159,51 @@ public class RuleService
         result = result.Replace("{ext}", file.Extension.TrimStart('.'));
 
         // {date:format} - modified date with custom format
-        var datePattern = new Regex(@"\{date:([^}]+)\}", RegexOptions.IgnoreCase);
-        result = datePattern.Replace(result, m =>
+        result = DateFormatPattern.Replace(result, m =>
         {
             var format = m.Groups[1].Value;
-            return file.LastWriteTime.ToString(format);
+            return modified.ToString(format);
         });
 
         // {created:format} - created date with custom format
-        var createdPattern = new Regex(@"\{created:([^}]+)\}", RegexOptions.IgnoreCase);
-        result = createdPattern.Replace(result, m =>
+        result = CreatedFormatPattern.Replace(result, m =>
         {
             var format = m.Groups[1].Value;
-            return file.CreationTime.ToString(format);
+            return created.ToString(format);
         });
 
         // {today:format} - current date with custom format
-        var todayPattern = new Regex(@"\{today:([^}]+)\}", RegexOptions.IgnoreCase);
-        result = todayPattern.Replace(result, m =>
+        result = TodayFormatPattern.Replace(result, m =>
         {
             var format = m.Groups[1].Value;
             return now.ToString(format);
         });
 
         // {Date} / {date} - modified date in default format
-        result = result.Replace("{Date}", file.LastWriteTime.ToString("yyyy-MM-dd"));
-        result = result.Replace("{date}", file.LastWriteTime.ToString("yyyy-MM-dd"));
+        var modifiedDate = modified.ToString("yyyy-MM-dd");
+        result = result.Replace("{Date}", modifiedDate);
+        result = result.Replace("{date}", modifiedDate);
 
         // {Today} / {today} - current date in default format
-        result = result.Replace("{Today}", now.ToString("yyyy-MM-dd"));
-        result = result.Replace("{today}", now.ToString("yyyy-MM-dd"));
+        var todayDate = now.ToString("yyyy-MM-dd");
+        result = result.Replace("{Today}", todayDate);
+        result = result.Replace("{today}", todayDate);
 
         // {Year}, {Month}, {Day} - modified date components
-        result = result.Replace("{Year}", file.LastWriteTime.Year.ToString());
-        result = result.Replace("{year}", file.LastWriteTime.Year.ToString());
-        result = result.Replace("{Month}", file.LastWriteTime.Month.ToString("D2"));
-        result = result.Replace("{month}", file.LastWriteTime.Month.ToString("D2"));
-        result = result.Replace("{Day}", file.LastWriteTime.Day.ToString("D2"));
-        result = result.Replace("{day}", file.LastWriteTime.Day.ToString("D2"));
+        var year = modified.Year.ToString();
+        var month = modified.Month.ToString("D2");
+        var day = modified.Day.ToString("D2");
+        result = result.Replace("{Year}", year);
+        result = result.Replace("{year}", year);
+        result = result.Replace("{Month}", month);
+        result = result.Replace("{month}", month);
+        result = result.Replace("{Day}", day);
+        result = result.Replace("{day}", day);
 
         // {CreatedYear}, {CreatedMonth}, {CreatedDay} - created date components
-        result = result.Replace("{CreatedYear}", file.CreationTime.Year.ToString());
-        result = result.Replace("{CreatedMonth}", file.CreationTime.Month.ToString("D2"));
-        result = result.Replace("{CreatedDay}", file.CreationTime.Day.ToString("D2"));
+        result = result.Replace("{CreatedYear}", created.Year.ToString());
+        result = result.Replace("{CreatedMonth}", created.Month.ToString("D2"));
+        result = result.Replace("{CreatedDay}", created.Day.ToString("D2"));
 
         // {Kind} / {kind} - file kind based on extension
         result = result.Replace("{Kind}", GetFileKind(file.Extension).ToString());
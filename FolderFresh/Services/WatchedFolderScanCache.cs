@@ -0,0 +1,197 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.IO;
+using System.Text.Json;
+using FolderFresh.Models;
+
+namespace FolderFresh.Services;
+
+/// <summary>
+/// Remembers which files each watched folder's last organize run left in place, so the next run
+/// can skip re-evaluating them while neither the file nor the configuration has changed.
+/// </summary>
+public class WatchedFolderScanCache
+{
+    private static readonly JsonSerializerOptions JsonOptions = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+    };
+
+    private readonly ConcurrentDictionary<string, FolderEntry> _folders = new();
+
+    /// <summary>
+    /// Builds a signature of everything that decides where a file goes, or null when the outcome
+    /// can change with the clock alone (date conditions, {today} tokens) and must not be cached.
+    /// </summary>
+    /// <param name="orderedRules">The enabled rules the scan evaluates.</param>
+    /// <param name="categories">The profile's categories used for category fallback.</param>
+    /// <param name="settings">The profile's settings.</param>
+    /// <param name="sharedCategories">
+    /// The category service's categories, which MoveToCategory, {Category} expansion and
+    /// destination calculation read regardless of which profile the folder uses.
+    /// </param>
+    public static string? GetConfigurationSignature(
+        List<Rule> orderedRules,
+        List<Category> categories,
+        AppSettings settings,
+        List<Category> sharedCategories)
+    {
+        foreach (var rule in orderedRules)
+        {
+            if (HasDateCondition(rule.Conditions))
+                return null;
+
+            foreach (var action in rule.Actions)
+            {
+                if (action.Value.Contains("{today", StringComparison.OrdinalIgnoreCase))
+                    return null;
+            }
+        }
+
+        var signature = JsonSerializer.Serialize(orderedRules, JsonOptions)
+            + JsonSerializer.Serialize(categories, JsonOptions)
+            + JsonSerializer.Serialize(settings, JsonOptions);
+
+        // The active profile's categories are the shared list itself - no need to serialize it twice
+        return ReferenceEquals(categories, sharedCategories)
+            ? signature
+            : signature + JsonSerializer.Serialize(sharedCategories, JsonOptions);
+    }
+
+    /// <summary>
+    /// Starts a scan of a watched folder. Returns null (and forgets the folder) when the
+    /// configuration can't be cached; otherwise the previous run's entries are reused only if
+    /// they were recorded against the same configuration.
+    /// </summary>
+    public Scan? BeginScan(string watchedFolderId, string? configurationSignature)
+    {
+        if (configurationSignature == null)
+        {
+            Remove(watchedFolderId);
+            return null;
+        }
+
+        var previous = _folders.TryGetValue(watchedFolderId, out var entry) && entry.ConfigurationSignature == configurationSignature
+            ? entry.Files
+            : null;
+
+        return new Scan(configurationSignature, previous);
+    }
+
+    /// <summary>
+    /// Stores the files a completed scan left in place. Replaces rather than merges, so files
+    /// that moved or disappeared drop out of the cache.
+    /// </summary>
+    public void CompleteScan(string watchedFolderId, Scan scan)
+    {
+        _folders[watchedFolderId] = new FolderEntry
+        {
+            ConfigurationSignature = scan.ConfigurationSignature,
+            Files = scan.Current
+        };
+    }
+
+    /// <summary>
+    /// Forgets a watched folder's cached files.
+    /// </summary>
+    public void Remove(string watchedFolderId)
+    {
+        _folders.TryRemove(watchedFolderId, out _);
+    }
+
+    private static bool HasDateCondition(ConditionGroup group)
+    {
+        foreach (var condition in group.Conditions)
+        {
+            if (condition.Attribute is ConditionAttribute.DateCreated
+                or ConditionAttribute.DateModified
+                or ConditionAttribute.DateAccessed)
+            {
+                return true;
+            }
+        }
+
+        foreach (var nestedGroup in group.NestedGroups)
+        {
+            if (HasDateCondition(nestedGroup))
+                return true;
+        }
+
+        return false;
+    }
+
+    /// <summary>
+    /// Unchanged-file lookups for a single scan: the previous run's entries and the ones collected now.
+    /// </summary>
+    public class Scan
+    {
+        private readonly Dictionary<string, FileStamp>? _previous;
+
+        internal Scan(string configurationSignature, Dictionary<string, FileStamp>? previous)
+        {
+            ConfigurationSignature = configurationSignature;
+            _previous = previous;
+        }
+
+        internal string ConfigurationSignature { get; }
+
+        internal Dictionary<string, FileStamp> Current { get; } = new(StringComparer.OrdinalIgnoreCase);
+
+        /// <summary>
+        /// Returns true if the previous run left this file in place and it hasn't changed since,
+        /// carrying the entry over to this scan. Uses the FileInfo's cached size and timestamps.
+        /// </summary>
+        public bool TryReuse(FileInfo fileInfo)
+        {
+            if (_previous == null
+                || !_previous.TryGetValue(fileInfo.FullName, out var stamp)
+                || !stamp.Matches(fileInfo))
+            {
+                return false;
+            }
+
+            Current[fileInfo.FullName] = stamp;
+            return true;
+        }
+
+        /// <summary>
+        /// Records a file this scan evaluated and left in place.
+        /// </summary>
+        public void RecordUnchanged(FileInfo fileInfo)
+        {
+            Current.TryAdd(fileInfo.FullName, FileStamp.From(fileInfo));
+        }
+    }
+
+    /// <summary>
+    /// Files a watched folder's last organize run left in place, with the configuration they were evaluated against.
+    /// </summary>
+    private class FolderEntry
+    {
+        public string ConfigurationSignature { get; set; } = "";
+        public Dictionary<string, FileStamp> Files { get; set; } = new(StringComparer.OrdinalIgnoreCase);
+    }
+
+    /// <summary>
+    /// Size and timestamps identifying a version of a file.
+    /// </summary>
+    internal class FileStamp
+    {
+        public long Length { get; init; }
+        public DateTime LastWriteTimeUtc { get; init; }
+        public DateTime CreationTimeUtc { get; init; }
+
+        public static FileStamp From(FileInfo fileInfo) => new()
+        {
+            Length = fileInfo.Length,
+            LastWriteTimeUtc = fileInfo.LastWriteTimeUtc,
+            CreationTimeUtc = fileInfo.CreationTimeUtc
+        };
+
+        public bool Matches(FileInfo fileInfo) =>
+            Length == fileInfo.Length
+            && LastWriteTimeUtc == fileInfo.LastWriteTimeUtc
+            && CreationTimeUtc == fileInfo.CreationTimeUtc;
+    }
+}
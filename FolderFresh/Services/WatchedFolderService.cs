@@ -217,8 +217,9 @@ public class WatchedFolderService
                 return (false, "Folder does not exist or is not accessible.");
             }
 
-            // Try to access the directory to verify permissions
-            _ = Directory.GetFiles(path, "*", SearchOption.TopDirectoryOnly);
+            // Try to access the directory to verify permissions. Opening the enumeration is
+            // enough to surface access errors, so stop at the first entry instead of listing every file.
+            _ = Directory.EnumerateFileSystemEntries(path).Any();
 
             return (true, null);
         }